@@ -0,0 +1,57 @@
+"""Compare enum construction with the decoding tables of :mod:`vblf.constants`.
+
+The tables replace the enum constructors on the hot path of the reader. Run from
+the repository root with ``python benchmarks/enum_decoding.py``, the columns show
+the time per call of the enum constructor, of the table lookup and the difference.
+"""
+
+import timeit
+from pathlib import Path
+
+from vblf.can import CanFdMessage64
+from vblf.constants import CAN_FD_FLAGS, OBJ_FLAGS, OBJ_TYPES, CanFdFlags, ObjFlags, ObjType
+
+NUMBER = 200_000
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def _obj_type_constructor(object_type: int) -> ObjType:
+    try:
+        return ObjType(object_type)
+    except ValueError:
+        return ObjType.UNKNOWN
+
+
+def _compare(name: str, constructor: str, table: str, namespace: dict[str, object]) -> None:
+    constructor_time = min(timeit.repeat(constructor, number=NUMBER, globals=namespace))
+    table_time = min(timeit.repeat(table, number=NUMBER, globals=namespace))
+    print(  # noqa: T201
+        f"{name:<24} {constructor_time / NUMBER * 1e9:8.1f} ns"
+        f" {table_time / NUMBER * 1e9:8.1f} ns"
+        f" {(constructor_time - table_time) / NUMBER * 1e9:8.1f} ns"
+    )
+
+
+def main() -> None:
+    can_fd_flags = int(CanFdFlags.FDF | CanFdFlags.BRS)
+    namespace: dict[str, object] = {
+        "ObjFlags": ObjFlags,
+        "CanFdFlags": CanFdFlags,
+        "OBJ_TYPES": OBJ_TYPES,
+        "OBJ_FLAGS": OBJ_FLAGS,
+        "CAN_FD_FLAGS": CAN_FD_FLAGS,
+        "obj_type_constructor": _obj_type_constructor,
+        "can_fd_flags": can_fd_flags,
+        "unpack": CanFdMessage64.unpack,
+        "buffer": (DATA_DIR / "CAN_FD_MESSAGE_64.lobj").read_bytes(),
+    }
+    print(f"{'':<24} {'enum':>11} {'table':>11} {'saved':>11}")  # noqa: T201
+    _compare("ObjType", "obj_type_constructor(101)", "OBJ_TYPES[101]", namespace)
+    _compare("ObjFlags", "ObjFlags(2)", "OBJ_FLAGS[2]", namespace)
+    _compare("CanFdFlags", "CanFdFlags(can_fd_flags)", "CAN_FD_FLAGS[can_fd_flags]", namespace)
+    unpack_time = min(timeit.repeat("unpack(buffer)", number=NUMBER, globals=namespace))
+    print(f"{'CanFdMessage64.unpack':<24} {unpack_time / NUMBER * 1e9:20.1f} ns")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,17 @@
-import contextlib
-from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
-with contextlib.suppress(PackageNotFoundError):
-    __version__ = version("vblf")
+
+def __getattr__(name: str) -> Any:
+    # the package version is looked up on first access, because importing
+    # importlib.metadata is slow
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+        try:
+            __version__ = globals()["__version__"] = version("vblf")
+        except PackageNotFoundError:
+            pass
+        else:
+            return __version__
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Optional
+
+
+class ContainerCache:
+    """Least recently used cache of decompressed LogContainer data.
+
+    A cache instance can be shared by several :class:`~vblf.reader.BlfReader` instances,
+    e.g. readers that were created with :meth:`~vblf.reader.BlfReader.from_cursor` to
+    jump back and forth in the same file. LogContainers are identified by the file and
+    their file offset, so each container is decompressed only once while it stays in
+    the cache. All methods are thread-safe.
+
+    :param max_size: Maximum number of uncompressed bytes in the cache, defaults to 64 MiB
+
+    :ivar hits: Number of successful lookups
+    :ivar misses: Number of failed lookups
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024) -> None:
+        """Initialize container cache.
+
+        See class documentation for details.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of uncompressed bytes in the cache."""
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached data of a LogContainer.
+
+        :param key: Key of the LogContainer
+        :returns: The uncompressed data or `None`, if the LogContainer is not cached
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: Hashable, data: bytes) -> None:
+        """Add the data of a LogContainer and evict the least recently used entries.
+
+        Data that is larger than `max_size` is not cached.
+
+        :param key: Key of the LogContainer
+        :param data: Uncompressed data of the LogContainer
+        """
+        if len(data) > self.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached LogContainers.
+
+        :returns: Number of entries
+        """
+        return len(self._entries)
@@ -4,7 +4,7 @@ from typing import ClassVar
 
 from typing_extensions import Self
 
-from vblf.constants import CanFdFlags, ObjFlags, ObjType
+from vblf.constants import CAN_FD_FLAGS, CanFdFlags, ObjFlags, ObjType
 
 from .general import ObjectHeader, ObjectWithHeader
 
@@ -205,7 +205,7 @@ class CanFdMessage(ObjectWithHeader[ObjectHeader]):
             frame_id,
             frame_length,
             arb_bit_count,
-            CanFdFlags(canfd_flags),
+            CAN_FD_FLAGS[canfd_flags],
             valid_data_bytes,
             reserved1,
             reserved2,
@@ -334,7 +334,7 @@ class CanFdMessage64(ObjectWithHeader[ObjectHeader]):
             tx_count,
             frame_id,
             frame_length,
-            CanFdFlags(flags),
+            CAN_FD_FLAGS[flags],
             btr_cfg_arb,
             btr_cfg_data,
             time_offset_brs_ns,
@@ -1,5 +1,5 @@
-from enum import IntEnum, IntFlag
-from typing import Final
+from enum import Enum, IntEnum, IntFlag
+from typing import Final, Optional, TypeVar
 
 FILE_SIGNATURE: Final = b"LOGG"
 OBJ_SIGNATURE: Final = b"LOBJ"
@@ -139,10 +139,7 @@ class ObjType(IntEnum):
 
     @staticmethod
     def from_int(object_type: int) -> "ObjType":
-        try:
-            return ObjType(object_type)
-        except ValueError:
-            return ObjType.UNKNOWN
+        return OBJ_TYPES[object_type]
 
 
 class AppId(IntEnum):
@@ -178,6 +175,18 @@ class Compression(IntEnum):
             return compression_level
 
 
+class CompressionMethod(IntEnum):
+    NONE = 0
+    ZLIB_DEFLATE = 2
+
+    @staticmethod
+    def from_int(compression_method: int) -> "CompressionMethod | int":
+        try:
+            return CompressionMethod(compression_method)
+        except ValueError:
+            return compression_method
+
+
 class ObjFlags(IntFlag):
     TIME_TEN_MICS = 0x1
     TIME_ONE_NANS = 0x2
@@ -247,3 +256,54 @@ class TriggerConditionStatus(IntEnum):
     START = 1
     STOP = 2
     STARTSTOP = 3
+
+
+EnumType = TypeVar("EnumType", bound=Enum)
+
+# maximum number of entries of a DecodingTable
+_MAX_TABLE_SIZE: Final = 4096
+
+
+class DecodingTable(dict[int, EnumType]):
+    """Lookup table that converts integers to enum members.
+
+    Looking up a value in a dict is much faster than calling the enum class,
+    which matters when a value is converted for every object. The table is
+    initialized with all members, other values are converted by the enum class
+    on first lookup and added to the table, e.g. combinations of flags.
+
+    :param enum_class: Enum class
+    :param default: Member that is returned for values that are not defined in
+        `enum_class`. If `None`, the enum class raises a :class:`ValueError`.
+    """
+
+    def __init__(self, enum_class: type[EnumType], default: Optional[EnumType] = None) -> None:
+        """Initialize decoding table.
+
+        See class documentation for details.
+        """
+        super().__init__((member.value, member) for member in enum_class)
+        self._enum_class = enum_class
+        self._default = default
+
+    def __missing__(self, value: int) -> EnumType:
+        try:
+            member = self._enum_class(value)
+        except ValueError:
+            if self._default is None:
+                raise
+            member = self._default
+        if len(self) < _MAX_TABLE_SIZE:
+            self[value] = member
+        return member
+
+
+OBJ_TYPES: Final = DecodingTable(ObjType, ObjType.UNKNOWN)
+OBJ_FLAGS: Final = DecodingTable(ObjFlags)
+TRIGGER_FLAGS: Final = DecodingTable(TriggerFlag)
+CAN_FD_FLAGS: Final = DecodingTable(CanFdFlags)
+SYS_VAR_TYPES: Final = DecodingTable(SysVarType)
+BUS_TYPES: Final = DecodingTable(BusType)
+FUNCTION_BUS_TYPES: Final = DecodingTable(FunctionBusType)
+TRIGGER_CONDITION_STATES: Final = DecodingTable(TriggerConditionStatus)
+APP_TEXT_SOURCES: Final = DecodingTable(AppTextSource)
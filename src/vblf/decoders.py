@@ -0,0 +1,58 @@
+import sys
+from collections.abc import Callable
+from importlib.metadata import entry_points
+from typing import Any, Final
+
+from vblf.constants import ObjType
+
+# function that decodes the data of an object including the object header
+ObjectDecoder = Callable[[bytes], Any]
+
+DECODERS_GROUP: Final = "vblf.decoders"
+
+
+def load_decoders(group: str = DECODERS_GROUP) -> dict[int, ObjectDecoder]:
+    """Load the object decoders that are registered as entry points.
+
+    The name of an entry point is an object type, either the name of an
+    :class:`~vblf.constants.ObjType` member or an integer. Its value refers to a
+    function that receives the object data including the object header, e.g. the
+    `unpack` method of an object class:
+
+    .. code-block:: toml
+
+        [project.entry-points."vblf.decoders"]
+        CAN_FD_MESSAGE_64 = "my_package.decoders:decode_can_fd_message_64"
+
+    The returned decoders can be passed to :class:`~vblf.reader.BlfReader`. They are
+    not registered globally, so other readers are not affected.
+
+    :param group: Entry point group
+    :returns: Decoders by object type
+    :raises ValueError: If the name of an entry point is not an object type
+    """
+    if sys.version_info >= (3, 10):
+        selected = entry_points(group=group)
+    else:
+        selected = entry_points().get(group, [])
+
+    decoders: dict[int, ObjectDecoder] = {}
+    for entry_point in selected:
+        decoders[_parse_object_type(entry_point.name)] = entry_point.load()
+    return decoders
+
+
+def _parse_object_type(name: str) -> int:
+    """Return the object type of an entry point name.
+
+    :param name: Name of an ObjType member or integer
+    :returns: Object type
+    :raises ValueError: If `name` is not an object type
+    """
+    if name in ObjType.__members__:
+        return ObjType[name]
+    try:
+        return int(name, 0)
+    except ValueError:
+        err_msg = f"Unknown object type {name!r}"
+        raise ValueError(err_msg) from None
@@ -5,14 +5,23 @@ from typing import ClassVar, Generic, Optional, TypeVar, Union
 
 from typing_extensions import Self
 
-from vblf import __version__
+import vblf
 from vblf.constants import (
+    APP_TEXT_SOURCES,
+    BUS_TYPES,
     FILE_SIGNATURE,
+    FUNCTION_BUS_TYPES,
+    OBJ_FLAGS,
     OBJ_SIGNATURE,
+    OBJ_TYPES,
+    SYS_VAR_TYPES,
+    TRIGGER_CONDITION_STATES,
+    TRIGGER_FLAGS,
     AppId,
     AppTextSource,
     BusType,
     Compression,
+    CompressionMethod,
     FunctionBusType,
     ObjFlags,
     ObjType,
@@ -101,7 +110,7 @@ class ObjectHeaderBase:
             header_size,
             header_version,
             object_size,
-            ObjType.from_int(object_type),
+            OBJ_TYPES[object_type],
         )
 
     @classmethod
@@ -118,7 +127,7 @@ class ObjectHeaderBase:
             header_size,
             header_version,
             object_size,
-            ObjType.from_int(object_type),
+            OBJ_TYPES[object_type],
         )
 
     def pack(self) -> bytes:
@@ -167,7 +176,7 @@ class VarObjectHeader(HeaderWithBase):
         ) = cls._FORMAT.unpack_from(buffer, ObjectHeaderBase.SIZE)
         return cls(
             base,
-            ObjFlags(object_flags),
+            OBJ_FLAGS[object_flags],
             object_static_size,
             object_version,
             object_time_stamp,
@@ -184,7 +193,7 @@ class VarObjectHeader(HeaderWithBase):
         ) = cls._FORMAT.unpack_from(buffer, offset + ObjectHeaderBase.SIZE)
         return cls(
             base,
-            ObjFlags(object_flags),
+            OBJ_FLAGS[object_flags],
             object_static_size,
             object_version,
             object_time_stamp,
@@ -230,7 +239,7 @@ class ObjectHeader(HeaderWithBase):
         ) = cls._FORMAT.unpack_from(buffer, ObjectHeaderBase.SIZE)
         return cls(
             base,
-            ObjFlags(object_flags),
+            OBJ_FLAGS[object_flags],
             client_index,
             object_version,
             object_time_stamp,
@@ -247,7 +256,7 @@ class ObjectHeader(HeaderWithBase):
         ) = cls._FORMAT.unpack_from(buffer, offset + ObjectHeaderBase.SIZE)
         return cls(
             base,
-            ObjFlags(object_flags),
+            OBJ_FLAGS[object_flags],
             client_index,
             object_version,
             object_time_stamp,
@@ -419,7 +428,7 @@ class FileStatistics:
 
     @classmethod
     def new(cls) -> Self:
-        major_version, minor_version, *_ = __version__.split(".")
+        major_version, minor_version, *_ = vblf.__version__.split(".")
         return cls(
             signature=FILE_SIGNATURE,
             statistics_size=FileStatistics.SIZE,
@@ -440,14 +449,69 @@ class FileStatistics:
 
 
 @dataclass
-class LogContainer(ObjectWithHeader[ObjectHeader]):
-    header: ObjectHeader
+class LogContainerHeader(HeaderWithBase):
+    _FORMAT: ClassVar[struct.Struct] = struct.Struct("HHIII")
+    SIZE: ClassVar[int] = ObjectHeaderBase.SIZE + _FORMAT.size
+    compression_method: Union[int, CompressionMethod]
+    reserved_log_container1: int
+    reserved_log_container2: int
+    uncompressed_size: int
+    reserved_log_container3: int
+
+    @classmethod
+    def unpack(cls, buffer: bytes) -> Self:
+        return cls.unpack_from(buffer, 0)
+
+    @classmethod
+    def unpack_from(cls, buffer: bytes, offset: int = 0) -> Self:
+        base = ObjectHeaderBase.unpack_from(buffer, offset)
+        (
+            compression_method,
+            reserved_log_container1,
+            reserved_log_container2,
+            uncompressed_size,
+            reserved_log_container3,
+        ) = cls._FORMAT.unpack_from(buffer, offset + ObjectHeaderBase.SIZE)
+        return cls(
+            base,
+            CompressionMethod.from_int(compression_method),
+            reserved_log_container1,
+            reserved_log_container2,
+            uncompressed_size,
+            reserved_log_container3,
+        )
+
+    def pack(self) -> bytes:
+        return self.base.pack() + self._FORMAT.pack(
+            self.compression_method,
+            self.reserved_log_container1,
+            self.reserved_log_container2,
+            self.uncompressed_size,
+            self.reserved_log_container3,
+        )
+
+    def pack_into(self, buffer: bytearray, offset: int) -> None:
+        self.base.pack_into(buffer, offset)
+        self._FORMAT.pack_into(
+            buffer,
+            offset + ObjectHeaderBase.SIZE,
+            self.compression_method,
+            self.reserved_log_container1,
+            self.reserved_log_container2,
+            self.uncompressed_size,
+            self.reserved_log_container3,
+        )
+
+
+@dataclass
+class LogContainer(ObjectWithHeader[LogContainerHeader]):
+    header: LogContainerHeader
     data: bytes
 
     @classmethod
     def unpack(cls, buffer: bytes) -> Self:
-        header = ObjectHeader.unpack_from(buffer)
-        return cls(header, buffer[ObjectHeader.SIZE :])
+        header = LogContainerHeader.unpack_from(buffer)
+        return cls(header, buffer[LogContainerHeader.SIZE :])
 
     def pack(self) -> bytes:
         return self.header.pack() + self.data
@@ -456,23 +520,23 @@ class LogContainer(ObjectWithHeader[ObjectHeader]):
     def new(
         cls,
         data: bytes,
-        time_stamp: int,
-        flags: ObjFlags = ObjFlags.TIME_ONE_NANS,
-        client_index: int = 0,
+        compression_method: CompressionMethod,
+        uncompressed_size: int,
     ) -> Self:
         base = ObjectHeaderBase(
             signature=OBJ_SIGNATURE,
-            header_size=ObjectHeader.SIZE,
+            header_size=LogContainerHeader.SIZE,
             header_version=1,
-            object_size=ObjectHeader.SIZE + len(data),
+            object_size=LogContainerHeader.SIZE + len(data),
             object_type=ObjType.LOG_CONTAINER,
         )
-        header = ObjectHeader(
+        header = LogContainerHeader(
             base=base,
-            object_flags=flags,
-            client_index=client_index,
-            object_version=0,
-            object_time_stamp=time_stamp,
+            compression_method=compression_method,
+            reserved_log_container1=0,
+            reserved_log_container2=0,
+            uncompressed_size=uncompressed_size,
+            reserved_log_container3=0,
         )
         return cls(
             header=header,
@@ -503,7 +567,7 @@ class AppText(ObjectWithHeader[ObjectHeader]):
         text = buffer[text_offset : text_offset + text_length - 1].decode("cp1252")
         return cls(
             header,
-            AppTextSource(source),
+            APP_TEXT_SOURCES[source],
             reserved1,
             text_length,
             reserved2,
@@ -552,7 +616,7 @@ class AppTrigger(ObjectWithHeader[ObjectHeader]):
             pre_trigger_time,
             post_trigger_time,
             channel,
-            TriggerFlag(flags),
+            TRIGGER_FLAGS[flags],
             app_specific,
         )
 
@@ -659,7 +723,7 @@ class SystemVariable(ObjectWithHeader[ObjectHeader]):
 
         return cls(
             header,
-            SysVarType(type_),
+            SYS_VAR_TYPES[type_],
             representation,
             reserved1,
             name_length,
@@ -733,7 +797,7 @@ class DriverOverrun(ObjectWithHeader[ObjectHeader]):
         ) = cls._FORMAT.unpack_from(buffer, ObjectHeader.SIZE)
         return cls(
             header,
-            BusType(bus_type),
+            BUS_TYPES[bus_type],
             channel,
             reserved,
         )
@@ -912,7 +976,7 @@ class FunctionBus(ObjectWithHeader[VarObjectHeader]):
 
         return cls(
             header,
-            FunctionBusType(object_type),
+            FUNCTION_BUS_TYPES[object_type],
             ve_type,
             name_length,
             data_length,
@@ -969,7 +1033,7 @@ class TriggerCondition(ObjectWithHeader[VarObjectHeader]):
 
         return cls(
             header,
-            TriggerConditionStatus(state),
+            TRIGGER_CONDITION_STATES[state],
             trigger_block_name_length,
             trigger_condition_length,
             trigger_block_name,
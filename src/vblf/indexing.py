@@ -0,0 +1,653 @@
+import itertools
+import os
+import struct
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, ClassVar, Final, Optional, Union
+
+from typing_extensions import Self
+
+from vblf.constants import ObjType
+from vblf.general import NotImplementedObject, ObjectHeaderBase, ObjectWithHeader
+from vblf.reader import (
+    FLAGS_TIME_STAMP,
+    FLAGS_TIME_STAMP_END,
+    FLAGS_TIME_STAMP_OFFSET,
+    OBJ_MAP,
+    BlfReader,
+    ReaderCursor,
+)
+from vblf.scan import CHANNEL_FIELDS, time_stamp_to_ns
+
+INDEX_SIGNATURE: Final = b"BLFI"
+FRAME_ID_INDEX_SIGNATURE: Final = b"BLFF"
+INDEX_VERSION: Final = 1
+
+BLOOM_FILTER_SIZE: Final = 256  # bytes
+BLOOM_FILTER_HASHES: Final = 3
+
+_FRAME_ID: Final = struct.Struct("I")
+_NO_TIME_STAMP: Final = 0xFFFF_FFFF_FFFF_FFFF
+# time stamps in 10 µs units can exceed 64 bits in nanoseconds, they are saturated
+_MAX_TIME_STAMP: Final = _NO_TIME_STAMP - 1
+_VARINT_CONTINUE: Final = 0x80
+
+# offset of the frame_id field for CAN object types
+FRAME_ID_OFFSETS: Final[dict[int, int]] = {
+    ObjType.CAN_MESSAGE: 36,
+    ObjType.CAN_MESSAGE2: 36,
+    ObjType.CAN_FD_MESSAGE: 36,
+    ObjType.CAN_FD_MESSAGE_64: 36,
+    ObjType.CAN_ERROR_EXT: 48,
+    ObjType.CAN_FD_ERROR_64: 44,
+}
+
+
+def bloom_filter_bits(frame_id: int) -> int:
+    """Return the bits that a CAN frame id sets in a bloom filter.
+
+    :param frame_id: CAN frame id as stored in the `frame_id` field of the object
+    :returns: Bit mask with :data:`BLOOM_FILTER_HASHES` bits set
+    """
+    value = (frame_id * 0x9E37_79B9_7F4A_7C15) & 0xFFFF_FFFF_FFFF_FFFF
+    hash1, hash2 = value >> 32, (value & 0xFFFF_FFFF) | 1
+    bits = 0
+    for i in range(BLOOM_FILTER_HASHES):
+        bits |= 1 << ((hash1 + i * hash2) % (BLOOM_FILTER_SIZE * 8))
+    return bits
+
+
+@dataclass
+class ContainerIndex:
+    """Statistics of the objects that start in one top level object, usually a LogContainer.
+
+    An object that straddles two LogContainers is counted for the LogContainer in which
+    it starts. Time stamps are given in nanoseconds, larger time stamps than fit into
+    64 bits are saturated.
+
+    :ivar offset: File offset of the LogContainer
+    :ivar object_size: Size of the LogContainer in the file
+    :ivar object_type: Object type of the top level object
+    :ivar data_size: Size of the uncompressed data of the LogContainer
+    :ivar first_object_offset: Offset of the first object that starts in this LogContainer
+        within its uncompressed data. The data before belongs to an object of a previous
+        LogContainer.
+    :ivar object_count: Number of objects that start in this LogContainer
+    :ivar min_time_stamp: Smallest object time stamp
+    :ivar max_time_stamp: Largest object time stamp
+    :ivar object_types: Object types of the objects
+    :ivar channels: Channels of the objects that have a channel field
+    :ivar frame_id_bloom_filter: Bloom filter of the CAN frame ids
+    """
+
+    _FORMAT: ClassVar[struct.Struct] = struct.Struct(f"QQQIIIIIHH{BLOOM_FILTER_SIZE}s")
+    offset: int
+    object_size: int
+    object_type: int
+    data_size: int
+    first_object_offset: int = 0
+    object_count: int = 0
+    min_time_stamp: Optional[int] = None
+    max_time_stamp: Optional[int] = None
+    object_types: set[int] = field(default_factory=set)
+    channels: set[int] = field(default_factory=set)
+    frame_id_bloom_filter: int = 0
+
+    @classmethod
+    def unpack_from(cls, buffer: bytes, offset: int = 0) -> Self:
+        (
+            container_offset,
+            min_time_stamp,
+            max_time_stamp,
+            object_size,
+            object_type,
+            data_size,
+            first_object_offset,
+            object_count,
+            object_type_count,
+            channel_count,
+            bloom_filter,
+        ) = cls._FORMAT.unpack_from(buffer, offset)
+        offset += cls._FORMAT.size
+        object_types = struct.unpack_from(f"{object_type_count}I", buffer, offset)
+        offset += 4 * object_type_count
+        channels = struct.unpack_from(f"{channel_count}H", buffer, offset)
+        return cls(
+            container_offset,
+            object_size,
+            object_type,
+            data_size,
+            first_object_offset,
+            object_count,
+            None if min_time_stamp == _NO_TIME_STAMP else min_time_stamp,
+            None if max_time_stamp == _NO_TIME_STAMP else max_time_stamp,
+            set(object_types),
+            set(channels),
+            int.from_bytes(bloom_filter, "little"),
+        )
+
+    def pack(self) -> bytes:
+        return (
+            self._FORMAT.pack(
+                self.offset,
+                _NO_TIME_STAMP if self.min_time_stamp is None else self.min_time_stamp,
+                _NO_TIME_STAMP if self.max_time_stamp is None else self.max_time_stamp,
+                self.object_size,
+                self.object_type,
+                self.data_size,
+                self.first_object_offset,
+                self.object_count,
+                len(self.object_types),
+                len(self.channels),
+                self.frame_id_bloom_filter.to_bytes(BLOOM_FILTER_SIZE, "little"),
+            )
+            + struct.pack(f"{len(self.object_types)}I", *sorted(self.object_types))
+            + struct.pack(f"{len(self.channels)}H", *sorted(self.channels))
+        )
+
+    def calc_size(self) -> int:
+        """Return the size of the packed data.
+
+        :returns: Number of bytes returned by :meth:`pack`
+        """
+        return self._FORMAT.size + 4 * len(self.object_types) + 2 * len(self.channels)
+
+    def cursor(self) -> ReaderCursor:
+        """Return a cursor to the first object that starts in this LogContainer.
+
+        :returns: Cursor for :meth:`~vblf.reader.BlfReader.from_cursor`
+        """
+        return ReaderCursor(self.offset, self.first_object_offset, b"")
+
+    def may_contain(
+        self,
+        start_time: Optional[int] = None,
+        stop_time: Optional[int] = None,
+        object_types: Optional[Iterable[int]] = None,
+        channels: Optional[Iterable[int]] = None,
+        frame_ids: Optional[Iterable[int]] = None,
+    ) -> bool:
+        """Check whether the LogContainer may contain matching objects.
+
+        All given conditions must match. The check for `frame_ids` may return
+        false positives.
+
+        :param start_time: Smallest time stamp in nanoseconds
+        :param stop_time: Largest time stamp in nanoseconds
+        :param object_types: Object types, one of which must be present
+        :param channels: Channels, one of which must be present
+        :param frame_ids: CAN frame ids, one of which must be present
+        :returns: `False`, if the LogContainer does not contain a matching object
+        """
+        if start_time is not None or stop_time is not None:
+            # a LogContainer without time stamped objects matches no time range
+            if self.min_time_stamp is None or self.max_time_stamp is None:
+                return False
+            if (start_time is not None and self.max_time_stamp < start_time) or (
+                stop_time is not None and self.min_time_stamp > stop_time
+            ):
+                return False
+        if object_types is not None and self.object_types.isdisjoint(object_types):
+            return False
+        if channels is not None and self.channels.isdisjoint(channels):
+            return False
+        if frame_ids is not None:
+            bloom_filter = self.frame_id_bloom_filter
+            return any(
+                bloom_filter & bits == bits
+                for bits in (bloom_filter_bits(frame_id) for frame_id in frame_ids)
+            )
+        return True
+
+
+@dataclass
+class BlfIndex:
+    """Index of the LogContainers of a BLF file.
+
+    Use :func:`build_index` to create an index and :meth:`pack` to store it
+    next to the BLF file.
+
+    :ivar file_size: Size of the BLF file that was indexed
+    :ivar containers: Statistics of each top level object in file order
+    """
+
+    _FORMAT: ClassVar[struct.Struct] = struct.Struct("4sHQI")
+    file_size: int
+    containers: list[ContainerIndex] = field(default_factory=list)
+
+    @classmethod
+    def unpack(cls, buffer: bytes) -> Self:
+        signature, version, file_size, container_count = cls._FORMAT.unpack_from(buffer)
+        if signature != INDEX_SIGNATURE or version != INDEX_VERSION:
+            err_msg = "Unexpected index format"
+            raise ValueError(err_msg)
+        offset = cls._FORMAT.size
+        containers = []
+        for _ in range(container_count):
+            container = ContainerIndex.unpack_from(buffer, offset)
+            offset += container.calc_size()
+            containers.append(container)
+        return cls(file_size, containers)
+
+    def pack(self) -> bytes:
+        return self._FORMAT.pack(
+            INDEX_SIGNATURE, INDEX_VERSION, self.file_size, len(self.containers)
+        ) + b"".join(container.pack() for container in self.containers)
+
+    def find(self, offset: int) -> int:
+        """Return the position of the first top level object at or behind a file offset.
+
+        :param offset: File offset
+        :returns: Index into :attr:`containers`, which equals the number of containers
+            if no object starts at or behind `offset`
+        """
+        low, high = 0, len(self.containers)
+        while low < high:
+            middle = (low + high) // 2
+            if self.containers[middle].offset < offset:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def select(
+        self,
+        start_time: Optional[int] = None,
+        stop_time: Optional[int] = None,
+        object_types: Optional[Iterable[int]] = None,
+        channels: Optional[Iterable[int]] = None,
+        frame_ids: Optional[Iterable[int]] = None,
+    ) -> list[ContainerIndex]:
+        """Return the LogContainers that may contain matching objects.
+
+        See :meth:`ContainerIndex.may_contain` for the parameters.
+
+        :returns: List of matching LogContainers in file order
+        """
+        object_types = None if object_types is None else set(object_types)
+        channels = None if channels is None else set(channels)
+        frame_ids = None if frame_ids is None else set(frame_ids)
+        return [
+            container
+            for container in self.containers
+            if container.may_contain(start_time, stop_time, object_types, channels, frame_ids)
+        ]
+
+
+@dataclass
+class FrameIdIndex:
+    """Inverted index from CAN channel and frame id to the positions of the objects.
+
+    A position is a tuple of the file offset of the LogContainer in which an object
+    starts and the offset of the object in the uncompressed data of that LogContainer.
+    The positions of each key are kept in file order in one array with alternating
+    LogContainer and object offsets. :meth:`pack` stores them delta encoded as
+    variable length integers.
+
+    :ivar positions: Positions of the objects per tuple of channel and frame id
+    """
+
+    _FORMAT: ClassVar[struct.Struct] = struct.Struct("4sHI")
+    _KEY_FORMAT: ClassVar[struct.Struct] = struct.Struct("HII")
+    positions: dict[tuple[int, int], "array[int]"] = field(default_factory=dict)
+
+    @classmethod
+    def unpack(cls, buffer: bytes) -> Self:
+        signature, version, key_count = cls._FORMAT.unpack_from(buffer)
+        if signature != FRAME_ID_INDEX_SIGNATURE or version != INDEX_VERSION:
+            err_msg = "Unexpected index format"
+            raise ValueError(err_msg)
+        offset = cls._FORMAT.size
+        positions = {}
+        for _ in range(key_count):
+            channel, frame_id, count = cls._KEY_FORMAT.unpack_from(buffer, offset)
+            offset += cls._KEY_FORMAT.size
+            key_positions = array("Q")
+            container_offset = object_offset = 0
+            for _ in range(count):
+                container_delta, offset = _read_varint(buffer, offset)
+                object_delta, offset = _read_varint(buffer, offset)
+                if container_delta:
+                    container_offset += container_delta
+                    object_offset = object_delta
+                else:
+                    object_offset += object_delta
+                key_positions.append(container_offset)
+                key_positions.append(object_offset)
+            positions[(channel, frame_id)] = key_positions
+        return cls(positions)
+
+    def pack(self) -> bytes:
+        data = bytearray(
+            self._FORMAT.pack(FRAME_ID_INDEX_SIGNATURE, INDEX_VERSION, len(self.positions))
+        )
+        for (channel, frame_id), key_positions in sorted(self.positions.items()):
+            data += self._KEY_FORMAT.pack(channel, frame_id, len(key_positions) // 2)
+            previous_container_offset = previous_object_offset = 0
+            for i in range(0, len(key_positions), 2):
+                container_offset, object_offset = key_positions[i], key_positions[i + 1]
+                if container_offset == previous_container_offset:
+                    _append_varint(data, 0)
+                    _append_varint(data, object_offset - previous_object_offset)
+                else:
+                    _append_varint(data, container_offset - previous_container_offset)
+                    _append_varint(data, object_offset)
+                previous_container_offset, previous_object_offset = container_offset, object_offset
+        return bytes(data)
+
+    def get(self, channel: int, frame_id: int) -> list[tuple[int, int]]:
+        """Return the positions of the objects with a channel and frame id.
+
+        :param channel: CAN channel
+        :param frame_id: CAN frame id as stored in the `frame_id` field of the object
+        :returns: List of positions in file order, see :func:`iter_objects_at`
+        """
+        key_positions = self.positions.get((channel, frame_id), array("Q"))
+        return list(zip(key_positions[::2], key_positions[1::2]))
+
+    def update(self, other: "FrameIdIndex") -> None:
+        """Append the positions of an index of the subsequent part of the file.
+
+        :param other: Index of LogContainers that follow the LogContainers of this index
+        """
+        for key, key_positions in other.positions.items():
+            if key in self.positions:
+                self.positions[key].extend(key_positions)
+            else:
+                self.positions[key] = array("Q", key_positions)
+
+
+def build_index(file: Union[str, os.PathLike[Any], BinaryIO]) -> BlfIndex:
+    """Build the index of a BLF file in a single pass.
+
+    Only the object headers, the channel and the CAN frame id of each object are parsed.
+
+    :param file: Path to BLF file or file-like object
+    :returns: Index of the file
+    """
+    with BlfReader(file) as reader:
+        containers: list[ContainerIndex] = []
+        frame_id_bits: dict[int, int] = {}
+        for container, _, buffer, start, end, object_type in _generate_located_records(
+            reader, containers
+        ):
+            _add_record(container, buffer, start, end, object_type, frame_id_bits)
+        return BlfIndex(reader._offset, containers)
+
+
+def build_frame_id_index(
+    file: Union[str, os.PathLike[Any], BinaryIO],
+    index: Optional[BlfIndex] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+) -> FrameIdIndex:
+    """Build the inverted CAN frame id index of a BLF file.
+
+    Without `executor` the file is read in a single pass. Given the `index` of the file
+    and an `executor`, e.g. a :class:`~concurrent.futures.ProcessPoolExecutor`, chunks
+    of `chunk_size` LogContainers are indexed in parallel, each by its own reader.
+    `file` must be a path in this case.
+
+    :param file: Path to BLF file or file-like object
+    :param index: Index of the file returned by :func:`build_index`
+    :param executor: Executor that indexes the chunks
+    :param chunk_size: Number of LogContainers per chunk
+    :returns: Inverted index of the file
+    """
+    if index is None or executor is None:
+        return _build_frame_id_index_chunk(file)
+
+    chunks = [
+        index.containers[i : i + chunk_size] for i in range(0, len(index.containers), chunk_size)
+    ]
+    frame_id_index = FrameIdIndex()
+    for chunk_index in executor.map(
+        _build_frame_id_index_chunk,
+        itertools.repeat(file),
+        [chunk[0].cursor() for chunk in chunks],
+        [chunk[-1].offset for chunk in chunks],
+    ):
+        frame_id_index.update(chunk_index)
+    return frame_id_index
+
+
+def iter_objects_at(
+    file: Union[str, os.PathLike[Any], BinaryIO], positions: Iterable[tuple[int, int]]
+) -> Iterator[ObjectWithHeader[Any]]:
+    """Read the objects at the given positions.
+
+    Each LogContainer is read once for all consecutive positions within it.
+
+    :param file: Path to BLF file or seekable file-like object
+    :param positions: Positions returned by :meth:`FrameIdIndex.get`
+    :returns: Iterator yielding parsed BLF objects
+    """
+    header_base_format = ObjectHeaderBase._FORMAT
+    with BlfReader(file) as reader:
+        for container_offset, group in itertools.groupby(positions, key=lambda p: p[0]):
+            reader._seek_cursor(ReaderCursor(container_offset, 0, b""))
+            containers = reader._containers
+            item = next(containers, None)
+            if item is None:
+                return
+            _, _, object_type, data = item
+            if object_type != ObjType.LOG_CONTAINER:
+                yield (OBJ_MAP.get(object_type) or NotImplementedObject).unpack(data)
+                continue
+
+            for _, object_offset in group:
+                while True:
+                    if len(data) - object_offset >= ObjectHeaderBase.SIZE:
+                        _, _, _, object_size, object_type = header_base_format.unpack_from(
+                            data, object_offset
+                        )
+                        if len(data) - object_offset >= object_size:
+                            break
+                    # the object continues in the next LogContainer
+                    item = next(containers, None)
+                    if item is None:
+                        return
+                    if item[2] == ObjType.LOG_CONTAINER:
+                        data += item[3]
+                obj_class: type[ObjectWithHeader[Any]] = (
+                    OBJ_MAP.get(object_type) or NotImplementedObject
+                )
+                yield obj_class.unpack(data[object_offset : object_offset + object_size])
+
+
+def iter_objects(
+    file: Union[str, os.PathLike[Any], BinaryIO], containers: Iterable[ContainerIndex]
+) -> Iterator[ObjectWithHeader[Any]]:
+    """Read the objects that start in the given LogContainers.
+
+    Use :meth:`BlfIndex.select` to find the LogContainers of interest. The objects are
+    not filtered, the caller has to check the conditions of the query for each object.
+
+    :param file: Path to BLF file or seekable file-like object
+    :param containers: LogContainers of the index of `file`
+    :returns: Iterator yielding parsed BLF objects
+    """
+    with BlfReader(file) as reader:
+        for container in containers:
+            reader._seek_cursor(container.cursor())
+            yield from itertools.islice(reader, container.object_count)
+
+
+def _build_frame_id_index_chunk(
+    file: Union[str, os.PathLike[Any], BinaryIO],
+    cursor: Optional[ReaderCursor] = None,
+    stop_offset: Optional[int] = None,
+) -> FrameIdIndex:
+    """Build the inverted CAN frame id index of a part of a BLF file.
+
+    :param file: Path to BLF file or file-like object
+    :param cursor: Cursor to the first object of the first LogContainer
+    :param stop_offset: File offset of the last LogContainer
+    :returns: Inverted index of the objects that start in the LogContainers
+    """
+    frame_id_index = FrameIdIndex()
+    positions = frame_id_index.positions
+    with BlfReader(file) as reader:
+        if cursor is not None:
+            reader._seek_cursor(cursor)
+        for container, object_offset, buffer, start, end, object_type in _generate_located_records(
+            reader
+        ):
+            if stop_offset is not None and container.offset > stop_offset:
+                break
+            frame_id_offset = FRAME_ID_OFFSETS.get(object_type)
+            if frame_id_offset is None or end - start < frame_id_offset + _FRAME_ID.size:
+                continue
+            channel_format, channel_offset = CHANNEL_FIELDS[object_type]
+            key = (
+                channel_format.unpack_from(buffer, start + channel_offset)[0],
+                _FRAME_ID.unpack_from(buffer, start + frame_id_offset)[0],
+            )
+            key_positions = positions.get(key)
+            if key_positions is None:
+                key_positions = positions[key] = array("Q")
+            key_positions.append(container.offset)
+            key_positions.append(object_offset)
+    return frame_id_index
+
+
+def _generate_located_records(
+    reader: BlfReader, containers: Optional[list[ContainerIndex]] = None
+) -> Iterator[tuple[ContainerIndex, int, bytes, int, int, int]]:
+    """Generate raw records together with the LogContainer in which they start.
+
+    Reading starts at the cursor of `reader`, which must point to the first object
+    of a LogContainer.
+
+    :param reader: Reader of the BLF file
+    :param containers: List that every top level object is appended to, before its
+        records are generated
+    :returns: Iterator yielding tuples of the LogContainer in which an object starts,
+        the offset of the object in the uncompressed data of that LogContainer, a buffer,
+        the start and end offset of the object in that buffer and its object type
+    """
+    position = reader._cursor.object_offset
+    # LogContainer and offset at which the incomplete data of the previous LogContainers
+    # starts
+    carry_over_container: Optional[ContainerIndex] = None
+    carry_over_position = 0
+
+    for offset, end_offset, object_type, data in reader._containers:
+        container = ContainerIndex(offset, end_offset - offset, object_type, len(data))
+        if containers is not None:
+            containers.append(container)
+        if object_type != ObjType.LOG_CONTAINER:
+            yield container, 0, data, 0, len(data), object_type
+            continue
+
+        carry_over = reader._incomplete_data
+        reader._incomplete_data = b""
+        uncompressed = carry_over + data
+        container.first_object_offset = len(data)
+        found_first = False
+        for buffer, start, end, record_type in reader._generate_container_records(
+            uncompressed, position
+        ):
+            if start < len(carry_over) and carry_over_container is not None:
+                yield (
+                    carry_over_container,
+                    carry_over_position + start,
+                    buffer,
+                    start,
+                    end,
+                    record_type,
+                )
+                continue
+            object_offset = start - len(carry_over)
+            if not found_first:
+                container.first_object_offset = object_offset
+                found_first = True
+            yield container, object_offset, buffer, start, end, record_type
+        position = 0
+        incomplete_start = len(uncompressed) - len(reader._incomplete_data)
+        if incomplete_start >= len(carry_over):
+            carry_over_container = container
+            carry_over_position = incomplete_start - len(carry_over)
+            if not found_first and reader._incomplete_data:
+                # the first object that starts in this container continues in the next one
+                container.first_object_offset = carry_over_position
+
+
+def _add_record(
+    container: ContainerIndex,
+    buffer: bytes,
+    start: int,
+    end: int,
+    object_type: int,
+    frame_id_bits: dict[int, int],
+) -> None:
+    """Add an object to the statistics of a LogContainer.
+
+    Fields that lie beyond the end of a short object are ignored.
+
+    :param container: Statistics that are updated
+    :param buffer: Buffer that contains the object
+    :param start: Offset of the object in `buffer`
+    :param end: End offset of the object in `buffer`
+    :param object_type: Object type
+    :param frame_id_bits: Cache of the bloom filter bits per frame id
+    """
+    container.object_count += 1
+    container.object_types.add(object_type)
+
+    object_size = end - start
+    if object_size < FLAGS_TIME_STAMP_END:
+        return
+    time_stamp = min(
+        time_stamp_to_ns(*FLAGS_TIME_STAMP.unpack_from(buffer, start + FLAGS_TIME_STAMP_OFFSET)),
+        _MAX_TIME_STAMP,
+    )
+    if container.min_time_stamp is None or time_stamp < container.min_time_stamp:
+        container.min_time_stamp = time_stamp
+    if container.max_time_stamp is None or time_stamp > container.max_time_stamp:
+        container.max_time_stamp = time_stamp
+
+    channel_field = CHANNEL_FIELDS.get(object_type)
+    if channel_field is not None:
+        channel_format, channel_offset = channel_field
+        if channel_offset + channel_format.size <= object_size:
+            container.channels.add(channel_format.unpack_from(buffer, start + channel_offset)[0])
+
+    frame_id_offset = FRAME_ID_OFFSETS.get(object_type)
+    if frame_id_offset is not None and frame_id_offset + _FRAME_ID.size <= object_size:
+        frame_id = _FRAME_ID.unpack_from(buffer, start + frame_id_offset)[0]
+        bits = frame_id_bits.get(frame_id)
+        if bits is None:
+            bits = frame_id_bits[frame_id] = bloom_filter_bits(frame_id)
+        container.frame_id_bloom_filter |= bits
+
+
+def _append_varint(data: bytearray, value: int) -> None:
+    """Append an unsigned integer in LEB128 encoding.
+
+    :param data: Buffer that the encoded value is appended to
+    :param value: Unsigned integer
+    """
+    while value >= _VARINT_CONTINUE:
+        data.append((value & 0x7F) | _VARINT_CONTINUE)
+        value >>= 7
+    data.append(value)
+
+
+def _read_varint(buffer: bytes, offset: int) -> tuple[int, int]:
+    """Read an unsigned integer in LEB128 encoding.
+
+    :param buffer: Buffer with the encoded value
+    :param offset: Offset of the encoded value in `buffer`
+    :returns: Tuple of the value and the offset behind the encoded value
+    """
+    value = shift = 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < _VARINT_CONTINUE:
+            return value, offset
+        shift += 7
@@ -0,0 +1,90 @@
+from typing import Any, Optional, get_args, get_origin
+
+from vblf.general import HeaderWithBase, ObjectHeaderBase, ObjectWithHeader
+
+_HEADER_CLASSES: dict[type[ObjectWithHeader[Any]], type[HeaderWithBase]] = {}
+
+
+class LazyObject(ObjectWithHeader[Any]):
+    """Proxy of a BLF object that decodes the object body on first access.
+
+    The object header is decoded immediately, so filtering by e.g.
+    ``header.object_time_stamp`` is cheap. Accessing any other attribute decodes the
+    whole object with the `unpack` method of its class, including strings and
+    payloads, and forwards the access to it. The decoded object is kept for further
+    accesses. Use :meth:`decode` to get the decoded object itself, e.g. for
+    ``isinstance`` checks.
+
+    :param object_class: Class of the object
+    :param buffer: Object data including the object header
+    """
+
+    def __init__(self, object_class: type[ObjectWithHeader[Any]], buffer: bytes) -> None:
+        """Initialize lazy object.
+
+        See class documentation for details.
+        """
+        self._object_class = object_class
+        self._buffer = buffer
+        self._object: Optional[ObjectWithHeader[Any]] = None
+        header_class = _header_class(object_class)
+        if header_class is HeaderWithBase:
+            self.header = HeaderWithBase(ObjectHeaderBase.unpack_from(buffer, 0))
+        else:
+            self.header = header_class.unpack_from(buffer, 0)
+
+    @property
+    def object_class(self) -> type[ObjectWithHeader[Any]]:
+        """Class of the object."""
+        return self._object_class
+
+    def decode(self) -> ObjectWithHeader[Any]:
+        """Decode the object.
+
+        :returns: The decoded object
+        """
+        if self._object is None:
+            self._object = self._object_class.unpack(self._buffer)
+        return self._object
+
+    def pack(self) -> bytes:
+        return self._buffer
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an attribute of the decoded object.
+
+        :param name: Name of the attribute
+        :returns: The attribute value
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.decode(), name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyObject):
+            other = other.decode()
+        return self.decode() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._object_class.__name__}, header={self.header!r})"
+
+
+def _header_class(object_class: type[ObjectWithHeader[Any]]) -> type[HeaderWithBase]:
+    """Return the header class of an object class.
+
+    :param object_class: Class of the object
+    :returns: Type of the `header` field
+    """
+    header_class = _HEADER_CLASSES.get(object_class)
+    if header_class is None:
+        # the header class is the type argument of ObjectWithHeader
+        header_class = next(
+            get_args(base)[0]
+            for cls in object_class.__mro__
+            for base in getattr(cls, "__orig_bases__", ())
+            if get_origin(base) is ObjectWithHeader
+        )
+        _HEADER_CLASSES[object_class] = header_class
+    return header_class
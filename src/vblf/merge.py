@@ -0,0 +1,143 @@
+import datetime
+import heapq
+import os
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from typing import Any, BinaryIO, Final, Union
+
+from vblf.general import NotImplementedObject, ObjectHeader, ObjectWithHeader, VarObjectHeader
+from vblf.reader import FLAGS_TIME_STAMP, FLAGS_TIME_STAMP_OFFSET, BlfReader
+from vblf.scan import time_stamp_to_ns
+
+_EPOCH: Final = datetime.datetime(1970, 1, 1)
+_BATCH_SIZE: Final = 1000
+
+
+def iter_merged(
+    files: Iterable[Union[str, bytes, os.PathLike[Any], BinaryIO]],
+    read_ahead: int = 10_000,
+) -> Iterator[tuple[int, int, ObjectWithHeader[Any]]]:
+    """Merge the objects of several BLF files by time stamp.
+
+    The object time stamps of each file are shifted by the
+    :attr:`~vblf.general.FileStatistics.measurement_start_time` of the file, so that
+    all objects are placed on one common timeline. The objects of each file are
+    expected to be sorted by time stamp.
+
+    Every file is read by its own background thread, which keeps up to `read_ahead`
+    parsed objects in memory. A slow file therefore does not block reading the others.
+
+    :param files: Paths to BLF files or file-like objects
+    :param read_ahead: Maximum number of objects that are read ahead per file
+    :returns: Iterator yielding tuples of the absolute time stamp in nanoseconds since
+        the epoch, the index of the source file in `files` and the object
+    """
+    with ExitStack() as stack:
+        readers = [stack.enter_context(BlfReader(file)) for file in files]
+        stop = threading.Event()
+
+        batch_size = max(1, min(_BATCH_SIZE, read_ahead))
+        queues: list[queue.Queue[Any]] = []
+        for index, reader in enumerate(readers):
+            q: queue.Queue[Any] = queue.Queue(maxsize=max(1, read_ahead // batch_size))
+            thread = threading.Thread(
+                target=_read_ahead,
+                args=(reader, q, stop, batch_size),
+                name=f"iter_merged-{index}",
+                daemon=True,
+            )
+            thread.start()
+            # stop threads before the readers are closed
+            stack.callback(thread.join)
+            stack.callback(stop.set)
+            queues.append(q)
+
+        yield from heapq.merge(
+            *(_iter_queue(q, index) for index, q in enumerate(queues)),
+            key=lambda item: item[0],
+        )
+
+
+def object_time_stamp_ns(obj: ObjectWithHeader[Any]) -> int:
+    """Return the object time stamp in nanoseconds.
+
+    :param obj: BLF object
+    :returns: Time stamp in nanoseconds relative to the measurement start
+    """
+    header = obj.header
+    if isinstance(header, (ObjectHeader, VarObjectHeader)):
+        return time_stamp_to_ns(header.object_flags, header.object_time_stamp)
+    if isinstance(obj, NotImplementedObject):
+        return time_stamp_to_ns(*FLAGS_TIME_STAMP.unpack_from(obj.buffer, FLAGS_TIME_STAMP_OFFSET))
+    return 0
+
+
+def _read_ahead(
+    reader: BlfReader, q: queue.Queue[Any], stop: threading.Event, batch_size: int
+) -> None:
+    """Read objects of one file into a queue.
+
+    Objects are put into the queue in batches of tuples of the absolute time stamp
+    and the object. The end of the file is signaled by ``None``, an error is passed
+    on as exception instance.
+
+    :param reader: Reader of the file
+    :param q: Queue that receives the batches
+    :param stop: Event to stop reading early
+    :param batch_size: Number of objects per batch
+    """
+    item: Any = None
+    try:
+        start_time = reader.file_statistics.measurement_start_time.to_datetime() - _EPOCH
+        offset = (start_time.days * 86400 + start_time.seconds) * 10**9
+        offset += start_time.microseconds * 1000
+        batch: list[tuple[int, ObjectWithHeader[Any]]] = []
+        for obj in reader:
+            batch.append((offset + object_time_stamp_ns(obj), obj))
+            if len(batch) >= batch_size:
+                if not _put(q, batch, stop):
+                    return
+                batch = []
+        if batch and not _put(q, batch, stop):
+            return
+    except Exception as exc:  # noqa: BLE001
+        item = exc
+    _put(q, item, stop)
+
+
+def _put(q: queue.Queue[Any], item: Any, stop: threading.Event) -> bool:
+    """Put an item into a queue, unless reading was stopped.
+
+    :param q: Queue that receives the item
+    :param item: Item to put into the queue
+    :param stop: Event to stop reading early
+    :returns: `False` if reading was stopped
+    """
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _iter_queue(
+    q: queue.Queue[Any], index: int
+) -> Iterator[tuple[int, int, ObjectWithHeader[Any]]]:
+    """Yield the objects that were read by :func:`_read_ahead`.
+
+    :param q: Queue with batches of objects
+    :param index: Index of the source file
+    :returns: Iterator yielding tuples of the absolute time stamp, `index` and the object
+    """
+    while True:
+        batch = q.get()
+        if batch is None:
+            return
+        if isinstance(batch, Exception):
+            raise batch
+        for time_stamp, obj in batch:
+            yield time_stamp, index, obj
@@ -1,51 +1,269 @@
+import functools
+import importlib
+import itertools
 import logging
+import mmap
 import os
+import re
+import struct
+import threading
+import time
 import zlib
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
 from contextlib import AbstractContextManager
-from io import BytesIO
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from types import TracebackType
-from typing import Any, BinaryIO, Final, Optional, Union
-
-from vblf.can import (
-    CanDriverError,
-    CanDriverErrorExt,
-    CanDriverHwSync,
-    CanDriverStatistic,
-    CanErrorFrame,
-    CanErrorFrameExt,
-    CanFdErrorFrame64,
-    CanFdMessage,
-    CanFdMessage64,
-    CanMessage,
-    CanMessage2,
-    CanOverloadFrame,
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Final, Optional, Union, cast
+
+from typing_extensions import Self
+
+from vblf.cache import ContainerCache
+from vblf.constants import (
+    CAN_FD_FLAGS,
+    FILE_SIGNATURE,
+    OBJ_FLAGS,
+    OBJ_SIGNATURE,
+    OBJ_SIGNATURE_SIZE,
+    OBJ_TYPES,
+    CompressionMethod,
+    ObjType,
 )
-from vblf.constants import FILE_SIGNATURE, OBJ_SIGNATURE, OBJ_SIGNATURE_SIZE, ObjType
-from vblf.ethernet import EthernetFrameEx, EthernetStatistic
-from vblf.flexray import FlexrayVFrReceiveMsgEx
 from vblf.general import (
-    AppText,
-    AppTrigger,
-    DriverOverrun,
-    EnvironmentVariable,
-    EventComment,
     FileStatistics,
-    FunctionBus,
-    GlobalMarker,
-    LogContainer,
+    LogContainerHeader,
     NotImplementedObject,
+    ObjectHeader,
     ObjectHeaderBase,
     ObjectWithHeader,
-    RealTimeClock,
-    SystemVariable,
-    TriggerCondition,
 )
-from vblf.lin import LinMessage, LinMessage2
-from vblf.tp_diag import DiagRequestInterpretation
+from vblf.lazy import LazyObject
+
+if TYPE_CHECKING:
+    from vblf.can import CanFdMessage64
+    from vblf.decoders import ObjectDecoder
+    from vblf.indexing import BlfIndex
 
 LOG = logging.getLogger("vblf")
 
+READ_BUFFER_SIZE: Final = 1024 * 1024
+REVERSE_SCAN_SIZE: Final = 64 * 1024
+
+# objects are aligned to 8 bytes
+_MAX_PADDING_SIZE: Final = 7
+
+# compression method and uncompressed size of the LogContainer header
+_LOG_CONTAINER_FIELDS: Final = struct.Struct("H6xI")
+
+# object flags and time stamp of ObjectHeader, ObjectHeader2 and VarObjectHeader
+FLAGS_TIME_STAMP: Final = struct.Struct("I4xQ")
+FLAGS_TIME_STAMP_OFFSET: Final = 16
+# minimum object size that contains the object flags and time stamp
+FLAGS_TIME_STAMP_END: Final = FLAGS_TIME_STAMP_OFFSET + FLAGS_TIME_STAMP.size
+
+# maximum compression ratio of deflate, larger uncompressed sizes are not plausible
+_MAX_DEFLATE_RATIO: Final = 1032
+
+
+@dataclass
+class ReaderCursor:
+    """Position of a :class:`BlfReader` that allows resuming later.
+
+    :ivar container_offset: File offset of the LogContainer (or top level object)
+        at which reading resumes
+    :ivar object_offset: Offset of the next object within the uncompressed data of
+        that LogContainer, including the prepended `carry_over`
+    :ivar carry_over: Incomplete object data of the previous LogContainer, which is
+        prepended to the uncompressed data of the LogContainer at `container_offset`
+    """
+
+    _FORMAT: ClassVar[struct.Struct] = struct.Struct("QQI")
+    container_offset: int
+    object_offset: int
+    carry_over: bytes
+
+    @classmethod
+    def unpack(cls, buffer: bytes) -> Self:
+        container_offset, object_offset, carry_over_length = cls._FORMAT.unpack_from(buffer)
+        carry_over = bytes(buffer[cls._FORMAT.size : cls._FORMAT.size + carry_over_length])
+        return cls(container_offset, object_offset, carry_over)
+
+    def pack(self) -> bytes:
+        return (
+            self._FORMAT.pack(self.container_offset, self.object_offset, len(self.carry_over))
+            + self.carry_over
+        )
+
+
+@dataclass
+class ContainerInfo:
+    """Metadata of a LogContainer, see :meth:`BlfReader.iter_containers`.
+
+    :ivar offset: File offset of the LogContainer
+    :ivar object_size: Size of the LogContainer including the object header
+    :ivar compression_method: Compression method of the LogContainer header
+    :ivar data: Data of the LogContainer as it is stored in the file
+    :ivar compressed: `True` if `data` is compressed with zlib
+    :ivar header_uncompressed_size: Uncompressed size of the LogContainer header
+    """
+
+    offset: int
+    object_size: int
+    compression_method: Union[int, CompressionMethod]
+    data: bytes = field(repr=False)
+    compressed: bool
+    header_uncompressed_size: int = field(default=0, repr=False)
+
+    @property
+    def end_offset(self) -> int:
+        """File offset behind the LogContainer."""
+        return self.offset + self.object_size
+
+    @property
+    def compressed_size(self) -> int:
+        """Size of the data as it is stored in the file."""
+        return len(self.data)
+
+    @cached_property
+    def uncompressed_size(self) -> int:
+        """Size of the uncompressed data.
+
+        The size of the LogContainer header is used, if it is plausible. Otherwise the
+        data is decompressed on first access.
+        """
+        if not self.compressed:
+            return len(self.data)
+        if 0 < self.header_uncompressed_size <= len(self.data) * _MAX_DEFLATE_RATIO:
+            return self.header_uncompressed_size
+        return len(zlib.decompress(self.data))
+
+
+@dataclass
+class ReaderStats:
+    """Counters and timings of :class:`BlfReader` instances.
+
+    Pass an instance to :class:`BlfReader` to collect them. An instance can be shared
+    by several readers to sum up their values. Times are measured with
+    :func:`time.perf_counter` in seconds. If no instance is passed, nothing is measured.
+
+    :ivar bytes_read: Number of bytes read from the file or buffer
+    :ivar containers_decompressed: Number of decompressed LogContainers, cache hits are
+        not counted
+    :ivar decompression_time: Time spent decompressing LogContainers
+    :ivar parse_time: Time spent parsing the returned objects by object type. Reading
+        and decompressing is not included.
+    :ivar object_counts: Number of returned objects by object type
+    :ivar resync_bytes: Number of bytes that were skipped to find the next object,
+        if more than padding was skipped
+    :ivar straddling_objects: Number of objects that started in one LogContainer and
+        ended in a later one
+    :ivar not_implemented_objects: Number of objects that were returned as
+        :class:`~vblf.general.NotImplementedObject`
+    """
+
+    bytes_read: int = 0
+    containers_decompressed: int = 0
+    decompression_time: float = 0.0
+    parse_time: dict[ObjType, float] = field(default_factory=dict)
+    object_counts: dict[ObjType, int] = field(default_factory=dict)
+    resync_bytes: int = 0
+    straddling_objects: int = 0
+    not_implemented_objects: int = 0
+
+    def _add_skipped(self, size: int) -> None:
+        """Count skipped bytes, unless they can be padding.
+
+        :param size: Number of skipped bytes
+        """
+        if size > _MAX_PADDING_SIZE:
+            self.resync_bytes += size
+
+
+class ObjectCursor:
+    """Reusable view of the objects of a :class:`BlfReader`, see :meth:`BlfReader.cursor`.
+
+    The cursor is moved to the next object with :func:`next` or by iterating over it,
+    which yields the cursor itself. No objects are created for the records,
+    the header fields are read from the raw data on access. Fields of the object
+    body can be read with :meth:`unpack_from`, the whole object is parsed with
+    :meth:`decode`.
+
+    :ivar buffer: Buffer that contains the current object
+    :ivar start: Offset of the current object in `buffer`
+    :ivar end: Offset behind the current object in `buffer`
+    :ivar object_type: Object type of the current object
+    """
+
+    __slots__ = ("_reader", "buffer", "end", "object_type", "start")
+
+    def __init__(self, reader: "BlfReader") -> None:
+        """Initialize object cursor.
+
+        :param reader: Reader of the objects
+        """
+        self._reader = reader
+        self.buffer = b""
+        self.start = 0
+        self.end = 0
+        self.object_type = 0
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> Self:
+        self.buffer, self.start, self.end, self.object_type = next(self._reader._records)
+        return self
+
+    @property
+    def object_size(self) -> int:
+        """Size of the current object."""
+        return self.end - self.start
+
+    @property
+    def object_flags(self) -> int:
+        """Object flags of the current object header."""
+        return int(
+            FLAGS_TIME_STAMP.unpack_from(self.buffer, self.start + FLAGS_TIME_STAMP_OFFSET)[0]
+        )
+
+    @property
+    def object_time_stamp(self) -> int:
+        """Object time stamp of the current object header."""
+        return int(
+            FLAGS_TIME_STAMP.unpack_from(self.buffer, self.start + FLAGS_TIME_STAMP_OFFSET)[1]
+        )
+
+    def unpack_from(self, fmt: struct.Struct, offset: int = 0) -> tuple[Any, ...]:
+        """Unpack fields of the current object.
+
+        :param fmt: Format of the fields
+        :param offset: Offset of the fields relative to the start of the object
+        :returns: The unpacked values
+        """
+        return fmt.unpack_from(self.buffer, self.start + offset)
+
+    def raw(self) -> bytes:
+        """Return the data of the current object.
+
+        :returns: Object data including the object header
+        """
+        return bytes(self.buffer[self.start : self.end])
+
+    def decode(self) -> ObjectWithHeader[Any]:
+        """Parse the current object.
+
+        :returns: The parsed BLF object
+        """
+        decoder = self._reader._decoders.get(self.object_type)
+        if decoder is not None:
+            obj: ObjectWithHeader[Any] = decoder(self.buffer[self.start : self.end])
+            return obj
+        obj_class: type[ObjectWithHeader[Any]] = (
+            OBJ_MAP.get(self.object_type) or NotImplementedObject
+        )
+        return obj_class.unpack(self.buffer[self.start : self.end])
+
 
 class BlfReader(AbstractContextManager["BlfReader"]):
     """Binary Log Format (BLF) file reader.
@@ -53,7 +271,32 @@ class BlfReader(AbstractContextManager["BlfReader"]):
     Reads Vector BLF log files and provides an iterator interface to access
     the contained objects. Handles automatic decompression of log containers.
 
-    :param file: Path to BLF file or file-like object
+    :param file: Path to BLF file, file-like object or a buffer with the file content
+        (``bytes``, ``bytearray``, ``memoryview`` or ``mmap``). A buffer is parsed in place
+        by offset, without copying it into a stream first. Compressed LogContainers are
+        decompressed directly from the buffer, but the data of uncompressed LogContainers
+        and other top level objects is copied once per top level object.
+    :param follow: If `True`, the reader does not stop at the end of the file but keeps
+        polling for new data, like ``tail -f``. Incomplete objects at the end of the file
+        are read again once the writer has completed them. Iteration never ends in
+        this mode, so the consumer has to stop it. Ignored for buffers.
+    :param poll_interval: Time in seconds to wait before polling again in follow mode
+    :param prefetch_size: If set, LogContainers are read and decompressed by a background
+        thread while the consumer parses the objects, up to this number of uncompressed
+        bytes ahead. This helps on storage with a high latency per read, e.g. network
+        file systems. Defaults to ``None`` (read on demand).
+    :param cache: Cache for decompressed LogContainers, that can be shared with other
+        readers of the same file. It is only used for files with a file descriptor.
+    :param lazy: If `True`, :class:`~vblf.lazy.LazyObject` proxies are returned, which
+        decode only the object header up front and the rest of the object on first
+        access. This is faster if most objects are filtered by their header.
+    :param decoders: Functions by object type, that decode the objects of this type
+        instead of the classes of :data:`OBJ_MAP`. A decoder receives the object data
+        including the object header and its return value is returned by the reader.
+        Decoders that are registered as entry points can be loaded with
+        :func:`vblf.decoders.load_decoders`.
+    :param stats: If set, counters and timings of the reader are added to it. This
+        slows down reading.
     :raises TypeError: If file parameter is of unsupported type
     :raises ValueError: If file format is invalid
 
@@ -61,88 +304,817 @@ class BlfReader(AbstractContextManager["BlfReader"]):
     :type file_statistics: FileStatistics
     """
 
-    def __init__(self, file: Union[str, bytes, os.PathLike[Any], BinaryIO]):
+    def __init__(
+        self,
+        file: Union[str, os.PathLike[Any], BinaryIO, bytes, bytearray, memoryview, mmap.mmap],
+        follow: bool = False,
+        poll_interval: float = 0.1,
+        prefetch_size: Optional[int] = None,
+        cache: Optional[ContainerCache] = None,
+        lazy: bool = False,
+        decoders: Optional[Mapping[int, "ObjectDecoder"]] = None,
+        stats: Optional[ReaderStats] = None,
+    ):
         """Initialize BLF reader.
 
         See class documentation for details.
         """
-        self._file: BinaryIO
-        if isinstance(file, (str, bytes, os.PathLike)):
+        self._file: Optional[BinaryIO] = None
+        self._buffer = memoryview(b"")
+        if isinstance(file, (str, os.PathLike)):
             self._file = open(file, "rb")  # noqa: SIM115
-        elif isinstance(file, bytes):
-            self._file = BytesIO(file)
+        elif isinstance(file, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._buffer = memoryview(file).cast("B")
         elif hasattr(file, "read"):
             self._file = file
         else:
-            err_msg = "Unsupported type {type(file)}"
+            err_msg = f"Unsupported type {type(file)}"
             raise TypeError(err_msg)
 
-        obj_data = self._file.read(FileStatistics.SIZE)
+        self._stats = stats
+        # serializes the access to the file position, which the read-ahead thread and
+        # the random access of iter_reverse() share
+        self._file_lock = threading.Lock()
+        self.file_statistics = self._read_file_statistics()
+
+        self._cache = cache
+        self._file_id: Optional[tuple[int, int, int]] = None
+        if cache is not None and self._file is not None:
+            try:
+                stat_result = os.fstat(self._file.fileno())
+            except (AttributeError, OSError, ValueError):
+                self._cache = None
+            else:
+                self._file_id = (stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime_ns)
+
+        self._follow = follow
+        self._lazy = lazy
+        self._decoders: dict[int, ObjectDecoder] = dict(decoders or {})
+        self._poll_interval = poll_interval
+        self._offset = FileStatistics.SIZE
+        self._incomplete_data: bytes = b""
+        self._cursor = ReaderCursor(self._offset, 0, b"")
+        self._prefetching = False
+        self._read_ahead: Optional[_ReadAhead] = None
+        # set when the reader is closed or the read-ahead thread is stopped, it ends
+        # the polling in follow mode
+        self._stopped = threading.Event()
+        self._containers = self._generate_containers()
+        self._start_generators()
+        if prefetch_size:
+            self._start_read_ahead(prefetch_size)
+
+    def _read_file_statistics(self) -> FileStatistics:
+        """Read the file statistics at the start of the file.
+
+        :returns: The file statistics
+        :raises ValueError: If file format is invalid
+        """
+        if self._file is None:
+            obj_data = bytes(self._buffer[: FileStatistics.SIZE])
+        else:
+            obj_data = self._file.read(FileStatistics.SIZE)
+            # raw streams may return less data than requested
+            while len(obj_data) < FileStatistics.SIZE and (
+                chunk := self._file.read(FileStatistics.SIZE - len(obj_data))
+            ):
+                obj_data += chunk
+        if self._stats is not None:
+            self._stats.bytes_read += len(obj_data)
         if len(obj_data) < FileStatistics.SIZE or not obj_data.startswith(FILE_SIGNATURE):
             err_msg = "Unexpected file format"
             raise ValueError(err_msg)
+        return FileStatistics.unpack(obj_data)
 
-        self.file_statistics = FileStatistics.unpack(obj_data)
+    @classmethod
+    def from_cursor(
+        cls,
+        file: Union[str, os.PathLike[Any], BinaryIO, bytes, bytearray, memoryview, mmap.mmap],
+        cursor: ReaderCursor,
+        follow: bool = False,
+        poll_interval: float = 0.1,
+        prefetch_size: Optional[int] = None,
+        cache: Optional[ContainerCache] = None,
+        lazy: bool = False,
+        decoders: Optional[Mapping[int, "ObjectDecoder"]] = None,
+        stats: Optional[ReaderStats] = None,
+    ) -> Self:
+        """Open a BLF file and resume reading at a cursor.
 
-        self._incomplete_data: bytes = b""
-        self._generator = self._generate_objects(self._file)
+        The cursor must have been obtained with :meth:`tell_cursor` from a reader of the
+        same file. Data that was appended to the file in the meantime is read as usual.
+
+        :param file: Path to BLF file, seekable file-like object or buffer
+        :param cursor: Cursor returned by :meth:`tell_cursor`
+        :param follow: See class documentation
+        :param poll_interval: See class documentation
+        :param prefetch_size: See class documentation
+        :param cache: See class documentation
+        :param lazy: See class documentation
+        :param decoders: See class documentation
+        :param stats: See class documentation
+        :returns: BlfReader instance
+        """
+        reader = cls(
+            file,
+            follow=follow,
+            poll_interval=poll_interval,
+            cache=cache,
+            lazy=lazy,
+            decoders=decoders,
+            stats=stats,
+        )
+        reader._seek_cursor(cursor)
+        if prefetch_size:
+            reader._start_read_ahead(prefetch_size)
+        return reader
+
+    def tell_cursor(self) -> ReaderCursor:
+        """Return the current reading position.
+
+        The cursor points behind the last object that was returned and can be passed
+        to :meth:`from_cursor` to continue reading from there, e.g. after the file
+        has grown. Use :meth:`ReaderCursor.pack` to store it.
+
+        :returns: Cursor of the current reading position
+        """
+        return replace(self._cursor)
+
+    def _seek_cursor(self, cursor: ReaderCursor) -> None:
+        """Move the reader to the position of a cursor.
+
+        :param cursor: Cursor returned by :meth:`tell_cursor`
+        """
+        if self._file is not None:
+            self._file.seek(cursor.container_offset)
+        self._offset = cursor.container_offset
+        self._incomplete_data = cursor.carry_over
+        self._cursor = replace(cursor)
+        self._containers = self._generate_containers()
+        self._start_generators()
 
-    def _generate_objects(self, stream: BinaryIO) -> Iterator[ObjectWithHeader[Any]]:
-        """Generate objects from the BLF stream.
+    def _start_read_ahead(self, max_size: int) -> None:
+        """Read and decompress LogContainers in a background thread.
 
-        :param stream: Binary stream containing BLF data
+        :param max_size: Maximum number of uncompressed bytes that are read ahead
+        """
+        self._prefetching = True
+        self._read_ahead = _ReadAhead(self._containers, max_size, self._stopped)
+        self._containers = iter(self._read_ahead)
+        self._start_generators()
+
+    def _start_generators(self) -> None:
+        """Create the generators of the records and objects from `_containers`."""
+        if self._stats is None:
+            self._records = self._generate_records()
+            self._generator = self._generate_objects()
+        else:
+            # time spent in the records generator and type of the last record
+            self._records_time = 0.0
+            self._record_type = 0
+            self._records = self._generate_measured_records()
+            self._generator = self._generate_measured_objects(self._stats)
+
+    def _generate_measured_records(self) -> Iterator[tuple[bytes, int, int, int]]:
+        """Generate raw records and measure the time to create them.
+
+        :returns: See :meth:`_generate_records`
+        """
+        records = self._generate_records()
+        perf_counter = time.perf_counter
+        while True:
+            start = perf_counter()
+            record = next(records, None)
+            self._records_time += perf_counter() - start
+            if record is None:
+                return
+            self._record_type = record[3]
+            yield record
+
+    def _generate_measured_objects(self, stats: ReaderStats) -> Iterator[ObjectWithHeader[Any]]:
+        """Generate objects and add their parse time to `stats`.
+
+        :param stats: Statistics of the reader
         :returns: Iterator yielding parsed BLF objects
         """
+        objects = self._generate_objects()
+        decoders = self._decoders
+        perf_counter = time.perf_counter
         while True:
-            # find start of next object (search for b"LOBJ")
-            signature = stream.read(OBJ_SIGNATURE_SIZE)
-            if len(signature) != OBJ_SIGNATURE_SIZE:
-                self._incomplete_data = signature
-                break
-            if signature != OBJ_SIGNATURE:
-                # skip padding byte and try again
-                stream.seek(1 - OBJ_SIGNATURE_SIZE, os.SEEK_CUR)
-                continue
+            records_time = self._records_time
+            start = perf_counter()
+            try:
+                obj = next(objects)
+            except StopIteration:
+                return
+            parse_time = perf_counter() - start - (self._records_time - records_time)
+            object_type = OBJ_TYPES[self._record_type]
+            stats.parse_time[object_type] = stats.parse_time.get(object_type, 0.0) + parse_time
+            stats.object_counts[object_type] = stats.object_counts.get(object_type, 0) + 1
+            if object_type not in decoders and OBJ_MAP.get(object_type) is None:
+                stats.not_implemented_objects += 1
+            yield obj
 
-            # parse base header of object
-            header_base_data = signature + stream.read(ObjectHeaderBase.SIZE - OBJ_SIGNATURE_SIZE)
-            if len(header_base_data) < ObjectHeaderBase.SIZE:
-                self._incomplete_data = header_base_data
-                break
-            else:
-                header_base = ObjectHeaderBase.unpack(header_base_data)
+    def _generate_objects(self) -> Iterator[ObjectWithHeader[Any]]:
+        """Generate objects from the BLF file.
 
-            # read object data
-            obj_data = header_base_data + stream.read(
-                header_base.object_size - ObjectHeaderBase.SIZE
-            )
-            if len(obj_data) < header_base.object_size:
-                self._incomplete_data = obj_data
-                break
+        :returns: Iterator yielding parsed BLF objects
+        """
+        lazy = self._lazy
+        decoders = self._decoders
+        # run of objects with the same type and size, that are unpacked in bulk
+        run_buffer = b""
+        run_start = run_type = -1
+        run_stride = run_size = 0
+        run_values: Iterator[tuple[Any, ...]] = iter(())
+        run_build: Callable[[tuple[Any, ...]], Optional[ObjectWithHeader[Any]]] = _build_none
+        for buffer, start, end, object_type in self._records:
+            if (
+                start == run_start
+                and end - start == run_size
+                and object_type == run_type
+                and buffer is run_buffer
+            ):
+                run_start += run_stride
+                values = next(run_values, None)
+                obj = None if values is None else run_build(values)
+                if obj is not None:
+                    yield obj
+                    continue
+
+            if object_type in decoders:
+                yield decoders[object_type](buffer[start:end])
+                continue
 
             # find class for given object_type
             obj_class: type[ObjectWithHeader[Any]] = (
-                OBJ_MAP.get(header_base.object_type) or NotImplementedObject
+                OBJ_MAP.get(object_type) or NotImplementedObject
             )
+            if lazy:
+                yield LazyObject(obj_class, buffer[start:end])
+                continue
 
-            if obj_class is LogContainer:
-                # decompress data
-                container = LogContainer.unpack(obj_data)
-                uncompressed = (
-                    zlib.decompress(container.data)
-                    if self.file_statistics.compression_level > 0
-                    else container.data
+            decoder = _get_bulk_decoder(obj_class, end - start)
+            # do not restart a run for an object that the run could not create
+            if decoder is not None and start != run_start - run_stride:
+                # decode the following objects in bulk, as long as type and size match
+                bulk_format, run_build = decoder
+                run_stride = bulk_format.size
+                count = (len(buffer) - start) // run_stride
+                run_values = bulk_format.iter_unpack(
+                    memoryview(buffer)[start : start + count * run_stride]
                 )
+                run_buffer, run_start, run_type = buffer, start + run_stride, object_type
+                run_size = end - start
+                values = next(run_values, None)
+                obj = None if values is None else run_build(values)
+                if obj is not None:
+                    yield obj
+                    continue
+            yield obj_class.unpack(buffer[start:end])
+
+    def _generate_records(self) -> Iterator[tuple[bytes, int, int, int]]:
+        """Generate raw records from the BLF file.
+
+        LogContainers are decompressed and the contained objects are located, but
+        not parsed.
+
+        :returns: Iterator yielding tuples of a buffer, the start and end offset of
+            an object in that buffer and its object type
+        """
+        for offset, end_offset, object_type, data in self._containers:
+            if object_type == ObjType.LOG_CONTAINER:
+                # continue at the cursor position, if this container was not started yet
+                position = (
+                    self._cursor.object_offset if self._cursor.container_offset == offset else 0
+                )
+                self._cursor = ReaderCursor(offset, position, self._incomplete_data)
 
                 # prepend incomplete data of previous container
-                uncompressed = self._incomplete_data + uncompressed
+                carry_over_size = len(self._incomplete_data)
+                uncompressed = self._incomplete_data + data
                 self._incomplete_data = b""
 
                 # parse LogContainer data
-                yield from self._generate_objects(BytesIO(uncompressed))
+                yield from self._generate_container_records(uncompressed, position)
+                self._cursor = ReaderCursor(end_offset, 0, self._incomplete_data)
+
+                # the object that started in a previous container was completed
+                if (
+                    self._stats is not None
+                    and position < carry_over_size
+                    and carry_over_size >= OBJ_SIGNATURE_SIZE
+                    and len(self._incomplete_data) < len(uncompressed)
+                ):
+                    self._stats.straddling_objects += 1
+
+            else:
+                self._cursor = ReaderCursor(end_offset, 0, self._incomplete_data)
+                yield data, 0, len(data), object_type
+
+    def _generate_containers(
+        self, unpack: Optional[Callable[[int, int, memoryview], bytes]] = None
+    ) -> Iterator[tuple[int, int, int, bytes]]:
+        """Generate the top level objects of the BLF file.
+
+        :param unpack: Function that returns the data of a top level object from its
+            file offset, object type and object data, defaults to
+            :meth:`_unpack_top_level`
+        :returns: Iterator yielding tuples of the file offset, the end offset and the
+            object type of each top level object and its data. The data of a
+            LogContainer is returned uncompressed.
+        """
+        if unpack is None:
+            unpack = self._unpack_top_level
+        if self._file is None:
+            return self._generate_buffer_containers(self._buffer, unpack)
+        return self._generate_stream_containers(self._file, unpack)
+
+    def _generate_buffer_containers(
+        self, buffer: memoryview, unpack: Callable[[int, int, memoryview], bytes]
+    ) -> Iterator[tuple[int, int, int, bytes]]:
+        """Generate the top level objects of an in-memory BLF file.
+
+        The objects are located by offset in `buffer`. Compressed LogContainers are
+        decompressed directly from `buffer`. The data of other top level objects is
+        copied by `unpack`, because the objects in a LogContainer are searched with
+        ``bytes.find()``, which memoryviews do not provide.
+
+        :param buffer: Content of the BLF file
+        :param unpack: See :meth:`_generate_containers`
+        :returns: See :meth:`_generate_containers`
+        """
+        header_base_format = ObjectHeaderBase._FORMAT
+        buffer_size = len(buffer)
+        stats = self._stats
+        skipped = 0
+        while buffer_size - self._offset >= ObjectHeaderBase.SIZE:
+            offset = self._offset
+            signature, _, _, object_size, object_type = header_base_format.unpack_from(
+                buffer, offset
+            )
+            if signature != OBJ_SIGNATURE:
+                # skip padding byte and try again
+                self._offset += 1
+                skipped += 1
+                continue
+            end_offset = offset + object_size
+            if object_size < ObjectHeaderBase.SIZE or end_offset > buffer_size:
+                break
+            self._offset = end_offset
+            if stats is not None:
+                stats.bytes_read += skipped + object_size
+                stats._add_skipped(skipped)
+            skipped = 0
+
+            yield (
+                offset,
+                end_offset,
+                object_type,
+                unpack(offset, object_type, buffer[offset:end_offset]),
+            )
+
+    def _generate_stream_containers(
+        self, stream: BinaryIO, unpack: Callable[[int, int, memoryview], bytes]
+    ) -> Iterator[tuple[int, int, int, bytes]]:
+        """Generate the top level objects of a BLF file stream.
+
+        The stream is read in large chunks into a reusable buffer and the objects are
+        parsed out of it, so the stream does not need to be seekable. This keeps the
+        number of read calls low for pipes and compressed streams. Until the first object
+        is returned, only the data of that object is read, so that jumping to a cursor
+        to read a few objects does not read a whole chunk.
+
+        :param stream: BLF file
+        :param unpack: See :meth:`_generate_containers`
+        :returns: See :meth:`_generate_containers`
+        """
+        header_base_format = ObjectHeaderBase._FORMAT
+        stats = self._stats
+        skipped = 0
+        buffer = bytearray()
+        start = end = 0  # buffer[start:end] holds the data at file offset self._offset
+        first_object = True
+        while True:
+            required_size = ObjectHeaderBase.SIZE
+            if end - start >= ObjectHeaderBase.SIZE:
+                signature, _, _, object_size, object_type = header_base_format.unpack_from(
+                    buffer, start
+                )
+                if signature != OBJ_SIGNATURE:
+                    # skip padding bytes
+                    position = buffer.find(OBJ_SIGNATURE, start + 1, end)
+                    if position == -1:
+                        position = end - OBJ_SIGNATURE_SIZE + 1
+                    self._offset += position - start
+                    skipped += position - start
+                    start = position
+                    continue
+                if object_size < ObjectHeaderBase.SIZE:
+                    break
+                if end - start >= object_size:
+                    if stats is not None:
+                        stats._add_skipped(skipped)
+                    skipped = 0
+                    offset = self._offset
+                    self._offset += object_size
+                    with memoryview(buffer)[start : start + object_size] as obj_view:
+                        obj_data = unpack(offset, object_type, obj_view)
+                    start += object_size
+                    first_object = False
+                    yield offset, self._offset, object_type, obj_data
+                    continue
+                required_size = object_size
+
+            # move incomplete object to the front and fill the buffer
+            if start:
+                buffer[: end - start] = buffer[start:end]
+                end -= start
+                start = 0
+            _grow(buffer, required_size if first_object else max(required_size, READ_BUFFER_SIZE))
+            read_end = required_size if first_object else len(buffer)
+            with self._file_lock, memoryview(buffer)[end:read_end] as view:
+                size = _readinto(stream, view)
+            if stats is not None:
+                stats.bytes_read += size
+            if not size:
+                if self._wait_for_data():
+                    continue
+                break
+            end += size
+
+    def _unpack_top_level(self, offset: int, object_type: int, obj_data: memoryview) -> bytes:
+        """Return the data of a top level object.
+
+        :param offset: File offset of the object
+        :param object_type: Object type
+        :param obj_data: Object data including the object header
+        :returns: The uncompressed data of a LogContainer or the object data otherwise
+        """
+        if object_type != ObjType.LOG_CONTAINER:
+            return bytes(obj_data)
+        compression_method, uncompressed_size = _LOG_CONTAINER_FIELDS.unpack_from(
+            obj_data, ObjectHeaderBase.SIZE
+        )
+        data = obj_data[LogContainerHeader.SIZE :]
+        if not self._is_compressed(compression_method):
+            return bytes(data)
+        if self._cache is None:
+            return self._decompress(data, uncompressed_size)
+
+        key = (self._file_id, offset)
+        uncompressed = self._cache.get(key)
+        if uncompressed is None:
+            uncompressed = self._decompress(data, uncompressed_size)
+            self._cache.put(key, uncompressed)
+        return uncompressed
 
+    def _decompress(self, data: memoryview, uncompressed_size: int) -> bytes:
+        """Decompress the data of a LogContainer and measure the time.
+
+        :param data: Compressed data
+        :param uncompressed_size: See :func:`_decompress`
+        :returns: Uncompressed data
+        """
+        stats = self._stats
+        if stats is None:
+            return _decompress(data, uncompressed_size)
+        start = time.perf_counter()
+        uncompressed = _decompress(data, uncompressed_size)
+        stats.decompression_time += time.perf_counter() - start
+        stats.containers_decompressed += 1
+        return uncompressed
+
+    def _is_compressed(self, compression_method: int) -> bool:
+        """Return whether the data of a LogContainer is compressed.
+
+        Older versions of this package wrote the value of ``ZLIB_DEFLATE`` into the
+        compression method field of every LogContainer, so the compression level of
+        the file is checked as well.
+
+        :param compression_method: Compression method of the LogContainer header
+        :returns: `True` if the data must be decompressed
+        """
+        return (
+            compression_method == CompressionMethod.ZLIB_DEFLATE
+            and self.file_statistics.compression_level != 0
+        )
+
+    def _generate_container_records(
+        self, data: bytes, position: int = 0
+    ) -> Iterator[tuple[bytes, int, int, int]]:
+        """Generate raw records from the uncompressed data of a LogContainer.
+
+        Data of an incomplete object at the end of the container is kept
+        and prepended to the data of the next container.
+
+        :param data: Uncompressed LogContainer data
+        :param position: Offset in `data` at which parsing starts
+        :returns: Iterator yielding tuples of `data`, the start and end offset of
+            an object in `data` and its object type
+        """
+        header_base_format = ObjectHeaderBase._FORMAT
+        data_size = len(data)
+        stats = self._stats
+        while True:
+            # find start of next object, skip padding bytes
+            start = data.find(OBJ_SIGNATURE, position)
+            if stats is not None and start > position:
+                stats._add_skipped(start - position)
+            if start == -1:
+                self._incomplete_data = data[max(position, data_size - OBJ_SIGNATURE_SIZE + 1) :]
+                break
+            if data_size - start < ObjectHeaderBase.SIZE:
+                self._incomplete_data = data[start:]
+                break
+            _, _, _, object_size, object_type = header_base_format.unpack_from(data, start)
+            if object_size < ObjectHeaderBase.SIZE:
+                # invalid object size, continue search after signature
+                position = start + OBJ_SIGNATURE_SIZE
+                if stats is not None:
+                    stats.resync_bytes += OBJ_SIGNATURE_SIZE
+                continue
+            end = start + object_size
+            if end > data_size:
+                self._incomplete_data = data[start:]
+                break
+            position = end
+            self._cursor.object_offset = end
+            yield data, start, end, object_type
+
+    def _wait_for_data(self) -> bool:
+        """Wait for the file to grow in follow mode.
+
+        :returns: `True` if the caller shall try again, `False` if the end of the
+            file was reached and the reader is not in follow mode or is stopped
+        """
+        if not self._follow:
+            return False
+        return not self._stopped.wait(self._poll_interval)
+
+    def iter_containers(self) -> Iterator["ContainerInfo"]:
+        """Iterate over the LogContainers without decompressing them.
+
+        Iteration starts at the current position and advances the reader like the
+        iteration over the objects, so both should not be mixed. Other top level objects
+        are skipped. Iteration stops at an incomplete LogContainer, so a truncated file
+        can be detected by comparing :attr:`ContainerInfo.end_offset` of the last
+        LogContainer with the file size.
+
+        :returns: Iterator yielding the metadata of each LogContainer
+        """
+        containers = self._generate_containers(
+            lambda _offset, _object_type, obj_data: bytes(obj_data)
+        )
+        for offset, end_offset, object_type, obj_data in containers:
+            if object_type != ObjType.LOG_CONTAINER:
+                continue
+            header = LogContainerHeader.unpack_from(obj_data)
+            yield ContainerInfo(
+                offset,
+                end_offset - offset,
+                header.compression_method,
+                obj_data[LogContainerHeader.SIZE :],
+                self._is_compressed(header.compression_method),
+                header.uncompressed_size,
+            )
+
+    def iter_reverse(self) -> Iterator[ObjectWithHeader[Any]]:
+        """Iterate over the objects in reverse order, starting at the end of the file.
+
+        The LogContainers are located by scanning the file backwards for their headers,
+        so the last objects of a large file are returned without reading the whole file.
+        An incomplete LogContainer at the end of the file and top level objects other
+        than LogContainers are skipped. This requires a
+        seekable file or a buffer and does not change the position of the forward
+        iteration, also while LogContainers are read ahead.
+
+        :returns: Iterator yielding parsed BLF objects from last to first
+        """
+        # start of the data of the following LogContainers that belongs to an object
+        # of a previous LogContainer
+        head = b""
+        at_end = True
+        for _, data in self._generate_containers_reverse():
+            buffer = data + head
+            records: list[tuple[int, int, int]] = []
+            for first in _find_all(buffer, OBJ_SIGNATURE, 0, len(data)):
+                records, complete = _walk_records(buffer, first)
+                if records and (complete or at_end):
+                    break
             else:
-                yield obj_class.unpack(obj_data)
+                # this LogContainer is part of a larger object
+                head = buffer
+                continue
+
+            at_end = False
+            head = buffer[:first]
+            for start, end, record_type in reversed(records):
+                decoder = self._decoders.get(record_type)
+                if decoder is not None:
+                    yield decoder(buffer[start:end])
+                    continue
+                obj_class: type[ObjectWithHeader[Any]] = (
+                    OBJ_MAP.get(record_type) or NotImplementedObject
+                )
+                if self._lazy:
+                    yield LazyObject(obj_class, buffer[start:end])
+                else:
+                    yield obj_class.unpack(buffer[start:end])
+
+    def tail(self, count: int) -> list[ObjectWithHeader[Any]]:
+        """Return the last objects of the file.
+
+        See :meth:`iter_reverse` for details.
+
+        :param count: Number of objects
+        :returns: List of the last `count` objects in file order
+        """
+        objects = list(itertools.islice(self.iter_reverse(), count))
+        objects.reverse()
+        return objects
+
+    def _generate_containers_reverse(self) -> Iterator[tuple[int, bytes]]:
+        """Generate the LogContainers of the BLF file from last to first.
+
+        Other top level objects are skipped.
+
+        :returns: Iterator yielding tuples of the file offset and the uncompressed data
+            of each LogContainer
+        """
+        header_base_format = ObjectHeaderBase._FORMAT
+        end = self._size()
+        if self.file_statistics.restore_points_offset:
+            end = min(end, self.file_statistics.restore_points_offset)
+        at_end = True
+        search_end = end
+        while search_end > FileStatistics.SIZE:
+            # search backwards for the header of the object that ends at `end`
+            window_start = max(FileStatistics.SIZE, search_end - REVERSE_SCAN_SIZE)
+            window = self._read_at(
+                window_start, min(end, search_end + ObjectHeaderBase.SIZE) - window_start
+            )
+            # the object header must be complete
+            position = window.rfind(
+                OBJ_SIGNATURE,
+                0,
+                min(
+                    search_end - window_start,
+                    len(window) - ObjectHeaderBase.SIZE + OBJ_SIGNATURE_SIZE,
+                ),
+            )
+            search_end = window_start
+            while position != -1:
+                offset = window_start + position
+                _, header_size, header_version, object_size, object_type = (
+                    header_base_format.unpack_from(window, position)
+                )
+                object_end = offset + object_size
+                # the header size is 16 in files of Vector and python-can
+                if (
+                    object_type == ObjType.LOG_CONTAINER
+                    and header_size in (ObjectHeaderBase.SIZE, LogContainerHeader.SIZE)
+                    and header_version == 1
+                ):
+                    # the last complete LogContainer may be followed by a torn header
+                    # or padding of a crashed writer
+                    if 0 <= end - object_end <= _MAX_PADDING_SIZE or (at_end and object_end <= end):
+                        obj_data = self._read_at(offset, object_size)
+                        yield (
+                            offset,
+                            self._unpack_top_level(offset, object_type, memoryview(obj_data)),
+                        )
+                        end = search_end = offset
+                        at_end = False
+                        break
+                    if at_end and object_end > end:
+                        # incomplete LogContainer at the end of the file
+                        end = search_end = offset
+                        break
+                position = window.rfind(OBJ_SIGNATURE, 0, position)
+
+    def _size(self) -> int:
+        """Return the size of the BLF file.
+
+        :returns: Size in bytes
+        """
+        if self._file is None:
+            return len(self._buffer)
+        with self._file_lock:
+            position = self._file.tell()
+            size = self._file.seek(0, os.SEEK_END)
+            self._file.seek(position)
+        return size
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        """Read data at a file offset without changing the stream position.
+
+        :param offset: File offset
+        :param size: Number of bytes
+        :returns: The data, which may be shorter than `size` at the end of the file
+        """
+        if self._file is None:
+            data = bytes(self._buffer[offset : offset + size])
+        else:
+            with self._file_lock:
+                position = self._file.tell()
+                self._file.seek(offset)
+                data = self._file.read(size)
+                self._file.seek(position)
+        if self._stats is not None:
+            self._stats.bytes_read += len(data)
+        return data
+
+    def skip(self, count: int, index: Optional["BlfIndex"] = None) -> int:
+        """Skip objects without parsing them.
+
+        The objects are located by the object size in their header only. If the `index`
+        of the file is given, LogContainers whose objects are all skipped are neither
+        read nor decompressed. The index is not used while LogContainers are prefetched.
+
+        :param count: Number of objects to skip
+        :param index: Index of the file, see :func:`vblf.indexing.build_index`
+        :returns: Number of skipped objects, which is less than `count` at the end
+            of the file
+        """
+        skipped = 0
+        if index is not None and count > 0 and not self._prefetching:
+            skipped = self._skip_containers(count, index)
+        for _ in itertools.islice(self._records, count - skipped):
+            skipped += 1
+        return skipped
+
+    def cursor(self) -> ObjectCursor:
+        """Return a cursor for scanning the raw objects.
+
+        The cursor is one reusable object, that points to the next object on every step
+        instead of creating new objects. It shares the reading position with the
+        iteration over the objects.
+
+        :returns: Object cursor
+        """
+        return ObjectCursor(self)
+
+    def head(self, count: int) -> list[ObjectWithHeader[Any]]:
+        """Return the next objects.
+
+        Together with :meth:`skip` this allows paging through a file.
+
+        :param count: Maximum number of objects
+        :returns: List of parsed BLF objects, which is shorter than `count` at the end
+            of the file
+        """
+        return list(itertools.islice(self._generator, count))
+
+    def _skip_containers(self, count: int, index: "BlfIndex") -> int:
+        """Skip whole top level objects with the object counts of an index.
+
+        :param count: Maximum number of objects to skip
+        :param index: Index of the file
+        :returns: Number of skipped objects
+        """
+        containers = index.containers
+        cursor = self._cursor
+        position = index.find(cursor.container_offset)
+        if (
+            position == len(containers)
+            or containers[position].offset - cursor.container_offset > _MAX_PADDING_SIZE
+        ):
+            return 0
+
+        # count the objects that are left in the current container
+        container = containers[position]
+        if not cursor.carry_over and cursor.object_offset == container.first_object_offset:
+            remaining = container.object_count
+        elif container.object_type == ObjType.LOG_CONTAINER:
+            obj_data = self._read_at(container.offset, container.object_size)
+            data = self._unpack_top_level(
+                container.offset, container.object_type, memoryview(obj_data)
+            )
+            # objects of the previous container that are completed in this one and
+            # objects of this container that were not read yet
+            carry_over_size = len(cursor.carry_over)
+            remaining = _count_records(
+                cursor.carry_over + data, cursor.object_offset, carry_over_size
+            )
+            remaining += container.object_count - _count_records(
+                data, container.first_object_offset, cursor.object_offset - carry_over_size
+            )
+        else:
+            return 0
+        if remaining > count:
+            return 0
+
+        skipped = remaining
+        position += 1
+        while position < len(containers) and skipped + containers[position].object_count <= count:
+            skipped += containers[position].object_count
+            position += 1
+        if position < len(containers):
+            self._seek_cursor(containers[position].cursor())
+        else:
+            self._seek_cursor(ReaderCursor(index.file_size, 0, b""))
+        return skipped
 
     def read_object(self) -> Optional[ObjectWithHeader[Any]]:
         """Retrieve the next parsed object from the BLF file.
@@ -180,22 +1152,620 @@ class BlfReader(AbstractContextManager["BlfReader"]):
         :param exc_value: Exception instance if an exception occurred
         :param traceback: Traceback if an exception occurred
         """
-        self._file.close()
+        self.close()
+
+    def close(self) -> None:
+        """Close the BLF file."""
+        # the read-ahead thread must not read the file or buffer after they are closed
+        self._stopped.set()
+        if self._read_ahead is not None:
+            self._read_ahead.stop()
+            self._read_ahead = None
+        if self._file is not None:
+            self._file.close()
+        # drop the generators first, they hold views of the buffer
+        self._generator = iter(())
+        self._records = iter(())
+        self._containers = iter(())
+        self._buffer.release()
+
+
+class BlfSequenceReader(AbstractContextManager["BlfSequenceReader"]):
+    """Reader for a sequence of BLF files that were split by a logger.
+
+    The files are read like one continuous file: an object that is split between
+    the last LogContainer of one file and the first LogContainer of the next file
+    is reassembled. While one file is parsed, the LogContainers of the next file are
+    read and decompressed in a background thread.
+
+    :param files: Paths to the BLF files in the order of recording or the path to
+        a directory. All ``*.blf`` files of a directory are read in natural sort order,
+        e.g. ``log_2.blf`` before ``log_10.blf``.
+    :param prefetch_size: Maximum number of uncompressed bytes that are read ahead
+        per file, defaults to 16 MiB
+    :param decoders: See :class:`BlfReader`
+    :param stats: See :class:`BlfReader`, the values of all files are added up
+    """
+
+    def __init__(
+        self,
+        files: Union[str, os.PathLike[str], Iterable[Union[str, os.PathLike[str]]]],
+        prefetch_size: int = 16 * 1024 * 1024,
+        decoders: Optional[Mapping[int, "ObjectDecoder"]] = None,
+        stats: Optional[ReaderStats] = None,
+    ) -> None:
+        """Initialize BLF sequence reader.
+
+        See class documentation for details.
+        """
+        self._files: list[Union[str, os.PathLike[str]]]
+        if isinstance(files, (str, os.PathLike)):
+            directory = os.fspath(files)
+            self._files = sorted(
+                (
+                    os.path.join(directory, name)
+                    for name in os.listdir(directory)
+                    if name.lower().endswith(".blf")
+                ),
+                key=_natural_sort_key,
+            )
+        else:
+            self._files = list(files)
+        self._prefetch_size = prefetch_size
+        self._decoders = decoders
+        self._stats = stats
+        self._readers: dict[int, BlfReader] = {}
+        self._index = 0
+        self._generator = self._generate_objects()
+
+    @property
+    def file_statistics(self) -> Optional[FileStatistics]:
+        """Statistics of the file that is currently read."""
+        reader = self._readers.get(self._index)
+        return reader.file_statistics if reader else None
+
+    def _open(self, index: int) -> Optional[BlfReader]:
+        """Open a file of the sequence and start reading it ahead.
+
+        :param index: Index of the file
+        :returns: BlfReader instance or `None` if `index` is out of range
+        """
+        if index >= len(self._files):
+            return None
+        if index not in self._readers:
+            self._readers[index] = BlfReader(
+                self._files[index],
+                prefetch_size=self._prefetch_size,
+                decoders=self._decoders,
+                stats=self._stats,
+            )
+        return self._readers[index]
+
+    def _generate_objects(self) -> Iterator[ObjectWithHeader[Any]]:
+        """Generate objects from all files of the sequence.
+
+        :returns: Iterator yielding parsed BLF objects
+        """
+        incomplete_data = b""
+        while (reader := self._open(self._index)) is not None:
+            # read next file ahead, while this file is parsed
+            self._open(self._index + 1)
+
+            # continue incomplete object of the previous file
+            reader._incomplete_data = incomplete_data
+            yield from reader
+            incomplete_data = reader._incomplete_data
+
+            self._readers.pop(self._index).close()
+            self._index += 1
+
+    def read_object(self) -> Optional[ObjectWithHeader[Any]]:
+        """Retrieve the next parsed object from the sequence of BLF files.
+
+        :returns: The next parsed BLF object or `None` if the end of the last file
+            is reached.
+        """
+        return next(self._generator, None)
+
+    def __iter__(self) -> Iterator[ObjectWithHeader[Any]]:
+        """Iterate over objects in all BLF files.
+
+        :returns: Iterator yielding parsed BLF objects
+        """
+        return self._generator.__iter__()
+
+    def __enter__(self) -> "BlfSequenceReader":
+        """Enter context manager.
+
+        :returns: BlfSequenceReader instance
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Exit context manager and close all open files.
+
+        :param exc_type: Exception type if an exception occurred
+        :param exc_value: Exception instance if an exception occurred
+        :param traceback: Traceback if an exception occurred
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Close all open files."""
+        while self._readers:
+            self._readers.popitem()[1].close()
+
+
+def _natural_sort_key(path: Union[str, os.PathLike[str]]) -> list[Union[int, str]]:
+    """Sort key that orders numbers in file names by value.
+
+    :param path: File path
+    :returns: Sort key
+    """
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", os.fspath(path))]
+
+
+def _readinto(stream: BinaryIO, buffer: memoryview) -> int:
+    """Read data from a stream into a buffer.
+
+    ``readinto1()`` is preferred, because it returns as soon as some data is
+    available instead of waiting for the buffer to be filled, e.g. on a pipe.
+
+    :param stream: Binary stream
+    :param buffer: Buffer that receives the data
+    :returns: Number of bytes read, 0 if no data is available
+    """
+    size: Optional[int]
+    if hasattr(stream, "readinto1"):
+        size = stream.readinto1(buffer)
+    elif hasattr(stream, "readinto"):
+        size = stream.readinto(buffer)
+    else:
+        data = stream.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+    return size or 0
+
 
+def _grow(buffer: bytearray, size: int) -> None:
+    """Extend a buffer with zero bytes to a minimum size.
 
-OBJ_MAP: Final[dict[ObjType, Optional[type[ObjectWithHeader[Any]]]]] = {
+    :param buffer: Buffer that is extended
+    :param size: Minimum size of the buffer
+    """
+    if size > len(buffer):
+        buffer.extend(bytes(size - len(buffer)))
+
+
+def _find_all(buffer: bytes, sub: bytes, start: int, end: int) -> Iterator[int]:
+    """Find all occurrences of a byte sequence.
+
+    :param buffer: Buffer to search
+    :param sub: Byte sequence to search for
+    :param start: Offset at which the search starts
+    :param end: Offset before which an occurrence must start
+    :returns: Iterator yielding the offsets of all occurrences in ascending order
+    """
+    position = buffer.find(sub, start, end + len(sub) - 1)
+    while position != -1:
+        yield position
+        position = buffer.find(sub, position + 1, end + len(sub) - 1)
+
+
+def _decompress(data: memoryview, uncompressed_size: int) -> bytes:
+    """Decompress the data of a LogContainer.
+
+    :param data: Compressed data
+    :param uncompressed_size: Uncompressed size of the LogContainer header. It is used
+        to allocate the output buffer, if it is plausible.
+    :returns: Uncompressed data
+    """
+    if 0 < uncompressed_size <= len(data) * _MAX_DEFLATE_RATIO:
+        return zlib.decompress(data, bufsize=uncompressed_size)
+    return zlib.decompress(data)
+
+
+def _count_records(data: bytes, position: int, end: Optional[int] = None) -> int:
+    """Count the complete objects that start in uncompressed LogContainer data.
+
+    Objects are located like in :meth:`BlfReader._generate_container_records`,
+    an incomplete object at the end of `data` is not counted.
+
+    :param data: Uncompressed LogContainer data
+    :param position: Offset in `data` at which counting starts
+    :param end: Offset in `data` before which an object must start, defaults to the
+        size of `data`
+    :returns: Number of objects
+    """
+    header_base_format = ObjectHeaderBase._FORMAT
+    data_size = len(data)
+    if end is None:
+        end = data_size
+    count = 0
+    while True:
+        start = data.find(OBJ_SIGNATURE, position, end + OBJ_SIGNATURE_SIZE - 1)
+        if start == -1 or data_size - start < ObjectHeaderBase.SIZE:
+            return count
+        object_size = header_base_format.unpack_from(data, start)[3]
+        if object_size < ObjectHeaderBase.SIZE:
+            position = start + OBJ_SIGNATURE_SIZE
+            continue
+        position = start + object_size
+        if position > data_size:
+            return count
+        count += 1
+
+
+def _walk_records(buffer: bytes, start: int) -> tuple[list[tuple[int, int, int]], bool]:
+    """Walk consecutive objects in uncompressed LogContainer data.
+
+    :param buffer: Uncompressed LogContainer data
+    :param start: Offset of the first object
+    :returns: Tuple of a list with the start offset, end offset and object type of
+        each complete object and a flag, whether the objects reach the end of `buffer`
+        without an incomplete object at the end
+    """
+    header_base_format = ObjectHeaderBase._FORMAT
+    records: list[tuple[int, int, int]] = []
+    buffer_size = len(buffer)
+    position = start
+    while True:
+        # skip padding bytes
+        next_start = buffer.find(
+            OBJ_SIGNATURE, position, position + _MAX_PADDING_SIZE + OBJ_SIGNATURE_SIZE
+        )
+        if next_start == -1:
+            return records, buffer_size - position <= _MAX_PADDING_SIZE
+        if buffer_size - next_start < ObjectHeaderBase.SIZE:
+            return records, False
+        _, _, _, object_size, object_type = header_base_format.unpack_from(buffer, next_start)
+        end = next_start + object_size
+        if object_size < ObjectHeaderBase.SIZE or end > buffer_size:
+            return records, False
+        records.append((next_start, end, object_type))
+        position = end
+
+
+class _ReadAhead:
+    """Consume an iterator of LogContainers in a background thread.
+
+    :param containers: Iterator returned by :meth:`BlfReader._generate_containers`
+    :param max_size: Maximum number of bytes that are buffered
+    :param stopped: Event that is set when the thread is stopped. It can be shared with
+        the producer of `containers` to end waiting for data.
+    """
+
+    def __init__(
+        self,
+        containers: Iterator[tuple[int, int, int, bytes]],
+        max_size: int,
+        stopped: threading.Event,
+    ) -> None:
+        """Initialize read-ahead and start the background thread.
+
+        See class documentation for details.
+        """
+        self._containers = containers
+        self._max_size = max_size
+        self._condition = threading.Condition()
+        self._buffered: deque[Any] = deque()
+        self._buffered_size = 0
+        self._stopped = stopped
+        self._thread = threading.Thread(
+            target=self._produce, name="BlfReader-read-ahead", daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self) -> None:
+        """Read containers into the buffer until the iterator is exhausted or stopped."""
+        item: Any = None
+        try:
+            for container in self._containers:
+                with self._condition:
+                    while self._buffered_size >= self._max_size and not self._stopped.is_set():
+                        self._condition.wait()
+                    if self._stopped.is_set():
+                        return
+                    self._buffered.append(container)
+                    self._buffered_size += len(container[3])
+                    self._condition.notify()
+        except Exception as exc:  # noqa: BLE001
+            item = exc
+        finally:
+            # drop the generator in this thread, it holds views of the reader buffer
+            self._containers = iter(())
+        with self._condition:
+            self._buffered.append(item)
+            self._condition.notify()
+
+    def __iter__(self) -> Iterator[tuple[int, int, int, bytes]]:
+        """Iterate over the containers that were read in the background thread.
+
+        :returns: Iterator yielding the items of `containers`
+        """
+        try:
+            while True:
+                with self._condition:
+                    while not self._buffered:
+                        self._condition.wait()
+                    item = self._buffered.popleft()
+                    if item is None:
+                        return
+                    if isinstance(item, Exception):
+                        raise item
+                    self._buffered_size -= len(item[3])
+                    self._condition.notify()
+                yield item
+        finally:
+            with self._condition:
+                self._stopped.set()
+                self._condition.notify()
+
+    def stop(self) -> None:
+        """Stop the background thread and wait until it has finished."""
+        with self._condition:
+            self._stopped.set()
+            self._condition.notify()
+        self._thread.join()
+        self._buffered.clear()
+
+
+def _build_header(values: tuple[Any, ...]) -> ObjectHeader:
+    """Create an object header from the first values of a bulk format.
+
+    :param values: Values unpacked with a format from :func:`_get_bulk_decoder`
+    :returns: Object header
+    """
+    base = ObjectHeaderBase(values[0], values[1], values[2], values[3], OBJ_TYPES[values[4]])
+    return ObjectHeader(base, OBJ_FLAGS[values[5]], values[6], values[7], values[8])
+
+
+def _build_none(values: tuple[Any, ...]) -> None:
+    """Bulk builder of an empty run.
+
+    :param values: Unpacked values
+    """
+
+
+def _build_fixed_size(
+    obj_class: type[ObjectWithHeader[Any]],
+    converters: dict[int, Callable[[Any], Any]],
+    values: tuple[Any, ...],
+) -> ObjectWithHeader[Any]:
+    """Create an object with a fixed size layout from bulk unpacked values.
+
+    :param obj_class: Object class
+    :param converters: Functions that convert the value at a position of the object body
+    :param values: Values unpacked with a format from :func:`_get_bulk_decoder`
+    :returns: BLF object
+    """
+    body = values[_HEADER_VALUE_COUNT:]
+    if converters:
+        converted = list(body)
+        for position, converter in converters.items():
+            converted[position] = converter(converted[position])
+        body = tuple(converted)
+    return obj_class(_build_header(values), *body)
+
+
+def _build_can_fd_message_64(
+    obj_class: type["CanFdMessage64"], values: tuple[Any, ...]
+) -> Optional["CanFdMessage64"]:
+    """Create a CanFdMessage64 without extended frame data from bulk unpacked values.
+
+    :param obj_class: Object class
+    :param values: Values unpacked with a format from :func:`_get_bulk_decoder`
+    :returns: CanFdMessage64 or `None` if the object has extended frame data
+    """
+    body = values[_HEADER_VALUE_COUNT:]
+    if body[13]:  # ext_data_offset
+        return None
+    (
+        channel,
+        dlc,
+        valid_data_bytes,
+        tx_count,
+        frame_id,
+        frame_length,
+        flags,
+        btr_cfg_arb,
+        btr_cfg_data,
+        time_offset_brs_ns,
+        time_offset_crc_del_ns,
+        bit_count,
+        direction,
+        ext_data_offset,
+        crc,
+        data,
+    ) = body
+    return obj_class(
+        _build_header(values),
+        channel,
+        dlc,
+        valid_data_bytes,
+        tx_count,
+        frame_id,
+        frame_length,
+        CAN_FD_FLAGS[flags],
+        btr_cfg_arb,
+        btr_cfg_data,
+        time_offset_brs_ns,
+        time_offset_crc_del_ns,
+        bit_count,
+        direction,
+        ext_data_offset,
+        crc,
+        data,
+        0,
+        0,
+    )
+
+
+def _get_bulk_decoder(
+    obj_class: type[ObjectWithHeader[Any]], object_size: int
+) -> Optional[tuple[struct.Struct, Callable[[tuple[Any, ...]], Optional[ObjectWithHeader[Any]]]]]:
+    """Return a format and a builder to unpack consecutive objects of one size in bulk.
+
+    The format covers the object header, the object body and the padding to the
+    next object, so that a run of objects can be unpacked with
+    :meth:`struct.Struct.iter_unpack`. The builder returns `None` for objects that
+    cannot be created from the unpacked values.
+
+    :param obj_class: Object class
+    :param object_size: Object size
+    :returns: Tuple of format and builder or `None`, if the object class does not
+        support bulk unpacking
+    """
+    key = (obj_class, object_size)
+    if key in _BULK_DECODERS:
+        return _BULK_DECODERS[key]
+
+    decoder = None
+    body_format = getattr(obj_class, "_FORMAT", None)
+    data_size = object_size - ObjectHeader.SIZE - (body_format.size if body_format else 0)
+    if body_format is not None and all(
+        struct.calcsize(f"={fmt.format}") == fmt.size
+        for fmt in (ObjectHeaderBase._FORMAT, ObjectHeader._FORMAT, body_format)
+    ):
+        formats = [ObjectHeaderBase._FORMAT.format, ObjectHeader._FORMAT.format]
+        name = f"{obj_class.__module__}:{obj_class.__qualname__}"
+        builder: Optional[Callable[[tuple[Any, ...]], Optional[ObjectWithHeader[Any]]]] = None
+        if name in _FIXED_SIZE_CLASSES and data_size == 0:
+            formats.append(body_format.format)
+            builder = functools.partial(_build_fixed_size, obj_class, _FIXED_SIZE_CLASSES[name])
+        elif name == "vblf.can:CanFdMessage64" and data_size >= 0:
+            formats.append(f"{body_format.format}{data_size}s")
+            builder = functools.partial(
+                _build_can_fd_message_64, cast("type[CanFdMessage64]", obj_class)
+            )
+        if builder is not None:
+            padding = -object_size % 8
+            decoder = (struct.Struct(f"={''.join(formats)}{padding}x"), builder)
+    _BULK_DECODERS[key] = decoder
+    return decoder
+
+
+# number of values of ObjectHeaderBase and ObjectHeader in a bulk format
+_HEADER_VALUE_COUNT: Final = 9
+
+# object classes with fixed size that are created from their header and the values of
+# their _FORMAT, with converters for single values of the object body. The classes are
+# given by name like in _OBJECT_CLASSES, so that their modules are not imported here.
+_FIXED_SIZE_CLASSES: Final[dict[str, dict[int, Callable[[Any], Any]]]] = {
+    "vblf.can:CanMessage": {},
+    "vblf.can:CanMessage2": {},
+    "vblf.can:CanFdMessage": {6: CAN_FD_FLAGS.__getitem__},
+    "vblf.can:CanErrorFrame": {},
+    "vblf.can:CanOverloadFrame": {},
+    "vblf.can:CanDriverError": {},
+    "vblf.can:CanDriverHwSync": {},
+}
+
+_BULK_DECODERS: dict[
+    tuple[type[ObjectWithHeader[Any]], int],
+    Optional[tuple[struct.Struct, Callable[[tuple[Any, ...]], Optional[ObjectWithHeader[Any]]]]],
+] = {}
+
+
+class _ObjectClassMap(MutableMapping[int, Optional[type[ObjectWithHeader[Any]]]]):
+    """Mapping of object types to object classes, which imports the classes on first use.
+
+    Unsupported object types map to `None`. Like a dict, classes can be added or
+    replaced to decode further object types.
+
+    :param classes: Object classes as ``"module:class"`` strings or `None` by object type
+    """
+
+    def __init__(self, classes: dict[int, Optional[str]]) -> None:
+        """Initialize object class map.
+
+        See class documentation for details.
+        """
+        self._names = dict(classes)
+        self._classes: dict[int, Optional[type[ObjectWithHeader[Any]]]] = {
+            object_type: None for object_type, name in classes.items() if name is None
+        }
+
+    def get(  # type: ignore[override]
+        self, object_type: int, default: Optional[type[ObjectWithHeader[Any]]] = None
+    ) -> Optional[type[ObjectWithHeader[Any]]]:
+        """Return the object class of an object type.
+
+        :param object_type: Object type
+        :param default: Value that is returned for unknown object types
+        :returns: The object class, `None` for unsupported object types or `default`
+        """
+        try:
+            return self._classes[object_type]
+        except KeyError:
+            if object_type not in self._names:
+                return default
+        return self[object_type]
+
+    def __getitem__(self, object_type: int) -> Optional[type[ObjectWithHeader[Any]]]:
+        """Return the object class of an object type.
+
+        :param object_type: Object type
+        :returns: The object class or `None` for unsupported object types
+        :raises KeyError: If the object type is unknown
+        """
+        try:
+            return self._classes[object_type]
+        except KeyError:
+            name = self._names[object_type]
+        obj_class = None
+        if name is not None:
+            module_name, _, class_name = name.partition(":")
+            obj_class = getattr(importlib.import_module(module_name), class_name)
+        self._classes[object_type] = obj_class
+        return obj_class
+
+    def __setitem__(
+        self, object_type: int, obj_class: Optional[type[ObjectWithHeader[Any]]]
+    ) -> None:
+        """Set the object class of an object type.
+
+        :param object_type: Object type
+        :param obj_class: Object class or `None` for an unsupported object type
+        """
+        self._names.setdefault(object_type, None)
+        self._classes[object_type] = obj_class
+
+    def __delitem__(self, object_type: int) -> None:
+        """Remove an object type.
+
+        :param object_type: Object type
+        :raises KeyError: If the object type is unknown
+        """
+        del self._names[object_type]
+        self._classes.pop(object_type, None)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# object classes by object type, the modules of the classes are imported on first use
+_OBJECT_CLASSES: Final[dict[int, Optional[str]]] = {
     ObjType.UNKNOWN: None,
-    ObjType.CAN_MESSAGE: CanMessage,
-    ObjType.CAN_ERROR: CanErrorFrame,
-    ObjType.CAN_OVERLOAD: CanOverloadFrame,
-    ObjType.CAN_STATISTIC: CanDriverStatistic,
-    ObjType.APP_TRIGGER: AppTrigger,
-    ObjType.ENV_INTEGER: EnvironmentVariable,
-    ObjType.ENV_DOUBLE: EnvironmentVariable,
-    ObjType.ENV_STRING: EnvironmentVariable,
-    ObjType.ENV_DATA: EnvironmentVariable,
-    ObjType.LOG_CONTAINER: LogContainer,
-    ObjType.LIN_MESSAGE: LinMessage,
+    ObjType.CAN_MESSAGE: "vblf.can:CanMessage",
+    ObjType.CAN_ERROR: "vblf.can:CanErrorFrame",
+    ObjType.CAN_OVERLOAD: "vblf.can:CanOverloadFrame",
+    ObjType.CAN_STATISTIC: "vblf.can:CanDriverStatistic",
+    ObjType.APP_TRIGGER: "vblf.general:AppTrigger",
+    ObjType.ENV_INTEGER: "vblf.general:EnvironmentVariable",
+    ObjType.ENV_DOUBLE: "vblf.general:EnvironmentVariable",
+    ObjType.ENV_STRING: "vblf.general:EnvironmentVariable",
+    ObjType.ENV_DATA: "vblf.general:EnvironmentVariable",
+    ObjType.LOG_CONTAINER: "vblf.general:LogContainer",
+    ObjType.LIN_MESSAGE: "vblf.lin:LinMessage",
     ObjType.LIN_CRC_ERROR: None,
     ObjType.LIN_DLC_INFO: None,
     ObjType.LIN_RCV_ERROR: None,
@@ -215,7 +1785,7 @@ OBJ_MAP: Final[dict[ObjType, Optional[type[ObjectWithHeader[Any]]]]] = {
     ObjType.reserved_3: None,
     ObjType.FLEXRAY_DATA: None,
     ObjType.FLEXRAY_SYNC: None,
-    ObjType.CAN_DRIVER_ERROR: CanDriverError,
+    ObjType.CAN_DRIVER_ERROR: "vblf.can:CanDriverError",
     ObjType.MOST_PKT: None,
     ObjType.MOST_PKT2: None,
     ObjType.MOST_HWMODE: None,
@@ -228,20 +1798,20 @@ OBJ_MAP: Final[dict[ObjType, Optional[type[ObjectWithHeader[Any]]]]] = {
     ObjType.FLEXRAY_MESSAGE: None,
     ObjType.LIN_CHECKSUM_INFO: None,
     ObjType.LIN_SPIKE_EVENT: None,
-    ObjType.CAN_DRIVER_SYNC: CanDriverHwSync,
+    ObjType.CAN_DRIVER_SYNC: "vblf.can:CanDriverHwSync",
     ObjType.FLEXRAY_STATUS: None,
     ObjType.GPS_EVENT: None,
     ObjType.FR_ERROR: None,
     ObjType.FR_STATUS: None,
     ObjType.FR_STARTCYCLE: None,
     ObjType.FR_RCVMESSAGE: None,
-    ObjType.REALTIMECLOCK: RealTimeClock,
+    ObjType.REALTIMECLOCK: "vblf.general:RealTimeClock",
     ObjType.AVAILABLE2: None,
     ObjType.AVAILABLE3: None,
     ObjType.LIN_STATISTIC: None,
     ObjType.J1708_MESSAGE: None,
     ObjType.J1708_VIRTUAL_MSG: None,
-    ObjType.LIN_MESSAGE2: LinMessage2,
+    ObjType.LIN_MESSAGE2: "vblf.lin:LinMessage2",
     ObjType.LIN_SND_ERROR2: None,
     ObjType.LIN_SYN_ERROR2: None,
     ObjType.LIN_CRC_ERROR2: None,
@@ -249,16 +1819,16 @@ OBJ_MAP: Final[dict[ObjType, Optional[type[ObjectWithHeader[Any]]]]] = {
     ObjType.LIN_WAKEUP2: None,
     ObjType.LIN_SPIKE_EVENT2: None,
     ObjType.LIN_LONG_DOM_SIG: None,
-    ObjType.APP_TEXT: AppText,
-    ObjType.FR_RCVMESSAGE_EX: FlexrayVFrReceiveMsgEx,
+    ObjType.APP_TEXT: "vblf.general:AppText",
+    ObjType.FR_RCVMESSAGE_EX: "vblf.flexray:FlexrayVFrReceiveMsgEx",
     ObjType.MOST_STATISTICEX: None,
     ObjType.MOST_TXLIGHT: None,
     ObjType.MOST_ALLOCTAB: None,
     ObjType.MOST_STRESS: None,
     ObjType.ETHERNET_FRAME: None,
-    ObjType.SYS_VARIABLE: SystemVariable,
-    ObjType.CAN_ERROR_EXT: CanErrorFrameExt,
-    ObjType.CAN_DRIVER_ERROR_EXT: CanDriverErrorExt,
+    ObjType.SYS_VARIABLE: "vblf.general:SystemVariable",
+    ObjType.CAN_ERROR_EXT: "vblf.can:CanErrorFrameExt",
+    ObjType.CAN_DRIVER_ERROR_EXT: "vblf.can:CanDriverErrorExt",
     ObjType.LIN_LONG_DOM_SIG2: None,
     ObjType.MOST_150_MESSAGE: None,
     ObjType.MOST_150_PKT: None,
@@ -270,25 +1840,25 @@ OBJ_MAP: Final[dict[ObjType, Optional[type[ObjectWithHeader[Any]]]]] = {
     ObjType.MOST_150_ALLOCTAB: None,
     ObjType.MOST_50_MESSAGE: None,
     ObjType.MOST_50_PKT: None,
-    ObjType.CAN_MESSAGE2: CanMessage2,
+    ObjType.CAN_MESSAGE2: "vblf.can:CanMessage2",
     ObjType.LIN_UNEXPECTED_WAKEUP: None,
     ObjType.LIN_SHORT_OR_SLOW_RESPONSE: None,
     ObjType.LIN_DISTURBANCE_EVENT: None,
     ObjType.SERIAL_EVENT: None,
-    ObjType.OVERRUN_ERROR: DriverOverrun,
-    ObjType.EVENT_COMMENT: EventComment,
+    ObjType.OVERRUN_ERROR: "vblf.general:DriverOverrun",
+    ObjType.EVENT_COMMENT: "vblf.general:EventComment",
     ObjType.WLAN_FRAME: None,
     ObjType.WLAN_STATISTIC: None,
     ObjType.MOST_ECL: None,
-    ObjType.GLOBAL_MARKER: GlobalMarker,
+    ObjType.GLOBAL_MARKER: "vblf.general:GlobalMarker",
     ObjType.AFDX_FRAME: None,
     ObjType.AFDX_STATISTIC: None,
     ObjType.KLINE_STATUSEVENT: None,
-    ObjType.CAN_FD_MESSAGE: CanFdMessage,
-    ObjType.CAN_FD_MESSAGE_64: CanFdMessage64,
+    ObjType.CAN_FD_MESSAGE: "vblf.can:CanFdMessage",
+    ObjType.CAN_FD_MESSAGE_64: "vblf.can:CanFdMessage64",
     ObjType.ETHERNET_RX_ERROR: None,
     ObjType.ETHERNET_STATUS: None,
-    ObjType.CAN_FD_ERROR_64: CanFdErrorFrame64,
+    ObjType.CAN_FD_ERROR_64: "vblf.can:CanFdErrorFrame64",
     ObjType.LIN_SHORT_OR_SLOW_RESPONSE2: None,
     ObjType.AFDX_STATUS: None,
     ObjType.AFDX_BUS_STATISTIC: None,
@@ -298,19 +1868,23 @@ OBJ_MAP: Final[dict[ObjType, Optional[type[ObjectWithHeader[Any]]]]] = {
     ObjType.A429_STATUS: None,
     ObjType.A429_BUS_STATISTIC: None,
     ObjType.A429_MESSAGE: None,
-    ObjType.ETHERNET_STATISTIC: EthernetStatistic,
+    ObjType.ETHERNET_STATISTIC: "vblf.ethernet:EthernetStatistic",
     ObjType.reserved_5: None,
     ObjType.reserved_6: None,
     ObjType.reserved_7: None,
     ObjType.TEST_STRUCTURE: None,
-    ObjType.DIAG_REQUEST_INTERPRETATION: DiagRequestInterpretation,
-    ObjType.ETHERNET_FRAME_EX: EthernetFrameEx,
+    ObjType.DIAG_REQUEST_INTERPRETATION: "vblf.tp_diag:DiagRequestInterpretation",
+    ObjType.ETHERNET_FRAME_EX: "vblf.ethernet:EthernetFrameEx",
     ObjType.ETHERNET_FRAME_FORWARDED: None,
     ObjType.ETHERNET_ERROR_EX: None,
     ObjType.ETHERNET_ERROR_FORWARDED: None,
-    ObjType.FUNCTION_BUS: FunctionBus,
+    ObjType.FUNCTION_BUS: "vblf.general:FunctionBus",
     ObjType.DATA_LOST_BEGIN: None,
     ObjType.DATA_LOST_END: None,
     ObjType.WATER_MARK_EVENT: None,
-    ObjType.TRIGGER_CONDITION: TriggerCondition,
+    ObjType.TRIGGER_CONDITION: "vblf.general:TriggerCondition",
 }
+
+OBJ_MAP: Final[MutableMapping[int, Optional[type[ObjectWithHeader[Any]]]]] = _ObjectClassMap(
+    _OBJECT_CLASSES
+)
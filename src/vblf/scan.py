@@ -0,0 +1,162 @@
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Final, Optional, Union
+
+from vblf.constants import ObjFlags, ObjType
+from vblf.general import FileStatistics
+from vblf.reader import (
+    FLAGS_TIME_STAMP,
+    FLAGS_TIME_STAMP_END,
+    FLAGS_TIME_STAMP_OFFSET,
+    BlfReader,
+)
+
+_CHANNEL_U8: Final = struct.Struct("B")
+_CHANNEL_U16: Final = struct.Struct("H")
+
+# location of the channel field for object types that have one
+CHANNEL_FIELDS: Final[dict[int, tuple[struct.Struct, int]]] = {
+    ObjType.CAN_MESSAGE: (_CHANNEL_U16, 32),
+    ObjType.CAN_ERROR: (_CHANNEL_U16, 32),
+    ObjType.CAN_OVERLOAD: (_CHANNEL_U16, 32),
+    ObjType.CAN_STATISTIC: (_CHANNEL_U16, 32),
+    ObjType.APP_TRIGGER: (_CHANNEL_U16, 48),
+    ObjType.LIN_MESSAGE: (_CHANNEL_U16, 32),
+    ObjType.CAN_DRIVER_ERROR: (_CHANNEL_U16, 32),
+    ObjType.CAN_DRIVER_SYNC: (_CHANNEL_U16, 32),
+    ObjType.LIN_MESSAGE2: (_CHANNEL_U16, 44),
+    ObjType.FR_RCVMESSAGE_EX: (_CHANNEL_U16, 32),
+    ObjType.CAN_ERROR_EXT: (_CHANNEL_U16, 32),
+    ObjType.CAN_DRIVER_ERROR_EXT: (_CHANNEL_U16, 32),
+    ObjType.CAN_MESSAGE2: (_CHANNEL_U16, 32),
+    ObjType.OVERRUN_ERROR: (_CHANNEL_U16, 36),
+    ObjType.CAN_FD_MESSAGE: (_CHANNEL_U16, 32),
+    ObjType.CAN_FD_MESSAGE_64: (_CHANNEL_U8, 32),
+    ObjType.CAN_FD_ERROR_64: (_CHANNEL_U8, 32),
+    ObjType.ETHERNET_STATISTIC: (_CHANNEL_U16, 32),
+    ObjType.ETHERNET_FRAME_EX: (_CHANNEL_U16, 36),
+}
+
+# channel field of object types without one, which lies beyond the end of any object
+_NO_CHANNEL_FIELD: Final = (_CHANNEL_U16, 0xFFFF_FFFF)
+
+
+def time_stamp_to_ns(object_flags: int, time_stamp: int) -> int:
+    """Convert an object time stamp to nanoseconds.
+
+    :param object_flags: Object flags of the object header
+    :param time_stamp: Object time stamp of the object header
+    :returns: Time stamp in nanoseconds
+    """
+    if object_flags & ObjFlags.TIME_TEN_MICS:
+        return time_stamp * 10_000
+    return time_stamp
+
+
+@dataclass
+class ObjTypeSummary:
+    """Summary of all objects of one object type.
+
+    Time stamps are given in nanoseconds.
+    """
+
+    count: int = 0
+    byte_count: int = 0
+    channels: set[int] = field(default_factory=set)
+    first_time_stamp: Optional[int] = None
+    last_time_stamp: Optional[int] = None
+
+
+@dataclass
+class FileSummary:
+    """Summary of a BLF file.
+
+    Time stamps are given in nanoseconds. `object_count` and `byte_count` are counted
+    while scanning, so unlike the values in `file_statistics` they are also correct
+    for files that were not closed properly.
+    """
+
+    file_statistics: FileStatistics
+    object_count: int = 0
+    byte_count: int = 0
+    first_time_stamp: Optional[int] = None
+    last_time_stamp: Optional[int] = None
+    object_types: dict[ObjType, ObjTypeSummary] = field(default_factory=dict)
+
+
+def summarize(file: Union[str, bytes, os.PathLike[Any], BinaryIO]) -> FileSummary:
+    """Count the objects of a BLF file per object type.
+
+    Only the object header and the channel field of each object are parsed.
+
+    :param file: Path to BLF file or file-like object
+    :returns: Summary of the file
+    """
+    with BlfReader(file) as reader:
+        summaries: dict[int, ObjTypeSummary] = {}
+        unpack_flags_time_stamp = FLAGS_TIME_STAMP.unpack_from
+        for buffer, start, end, object_type in reader._generate_records():
+            summary = summaries.get(object_type)
+            if summary is None:
+                summary = summaries[object_type] = ObjTypeSummary()
+            object_size = end - start
+            summary.count += 1
+            summary.byte_count += object_size
+
+            # objects that are too short for a time stamp or channel field are only counted
+            if object_size < FLAGS_TIME_STAMP_END:
+                continue
+            time_stamp = time_stamp_to_ns(
+                *unpack_flags_time_stamp(buffer, start + FLAGS_TIME_STAMP_OFFSET)
+            )
+            if summary.first_time_stamp is None or time_stamp < summary.first_time_stamp:
+                summary.first_time_stamp = time_stamp
+            if summary.last_time_stamp is None or time_stamp > summary.last_time_stamp:
+                summary.last_time_stamp = time_stamp
+
+            channel_format, channel_offset = CHANNEL_FIELDS.get(object_type, _NO_CHANNEL_FIELD)
+            if channel_offset + channel_format.size <= object_size:
+                summary.channels.add(channel_format.unpack_from(buffer, start + channel_offset)[0])
+
+        file_summary = FileSummary(reader.file_statistics)
+
+    for object_type, summary in summaries.items():
+        obj_type = ObjType.from_int(object_type)
+        if obj_type in file_summary.object_types:
+            # merge object types that are not defined in ObjType
+            _merge(file_summary.object_types[obj_type], summary)
+        else:
+            file_summary.object_types[obj_type] = summary
+        file_summary.object_count += summary.count
+        file_summary.byte_count += summary.byte_count
+        for limit in (summary.first_time_stamp, summary.last_time_stamp):
+            if limit is not None:
+                _add_time_stamp(file_summary, limit)
+    return file_summary
+
+
+def _add_time_stamp(summary: Union[ObjTypeSummary, FileSummary], time_stamp: int) -> None:
+    """Extend the time range of a summary.
+
+    :param summary: Summary that is updated
+    :param time_stamp: Time stamp in nanoseconds
+    """
+    if summary.first_time_stamp is None or time_stamp < summary.first_time_stamp:
+        summary.first_time_stamp = time_stamp
+    if summary.last_time_stamp is None or time_stamp > summary.last_time_stamp:
+        summary.last_time_stamp = time_stamp
+
+
+def _merge(summary: ObjTypeSummary, other: ObjTypeSummary) -> None:
+    """Add the values of `other` to `summary`.
+
+    :param summary: Summary that is updated
+    :param other: Summary that is added
+    """
+    summary.count += other.count
+    summary.byte_count += other.byte_count
+    summary.channels |= other.channels
+    for time_stamp in (other.first_time_stamp, other.last_time_stamp):
+        if time_stamp is not None:
+            _add_time_stamp(summary, time_stamp)
@@ -1,16 +1,106 @@
 import datetime
 import os
+import threading
 import time
 import zlib
+from collections.abc import Callable
 from contextlib import AbstractContextManager
-from typing import Any, BinaryIO, Final
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Final, Literal, Optional, Union
 
-from vblf.constants import Compression, ObjFlags
-from vblf.general import FileStatistics, HeaderWithBase, LogContainer, ObjectWithHeader, SystemTime
+from vblf.constants import OBJ_SIGNATURE, Compression, CompressionMethod, ObjType
+from vblf.general import (
+    FileStatistics,
+    HeaderWithBase,
+    LogContainer,
+    ObjectHeaderBase,
+    ObjectWithHeader,
+    SystemTime,
+)
+from vblf.reader import BlfReader
 
 BYTE_ALIGNMENT: Final = 8
 
 
+@dataclass
+class ContainerStats:
+    """Metrics of a LogContainer that was written by a :class:`BlfWriter`.
+
+    Times are measured with :func:`time.perf_counter` in seconds.
+
+    :ivar offset: File offset of the LogContainer
+    :ivar uncompressed_size: Size of the uncompressed data
+    :ivar compressed_size: Size of the data as it is stored in the file
+    :ivar compression_method: Compression method of the LogContainer
+    :ivar compression_time: Time spent compressing the data
+    :ivar write_time: Time spent writing the LogContainer to the file
+    :ivar stalled: `True` if the LogContainer was written by :meth:`BlfWriter.write`
+        because the buffer was full, so that the caller was blocked
+    """
+
+    offset: int
+    uncompressed_size: int
+    compressed_size: int
+    compression_method: Union[int, CompressionMethod]
+    compression_time: float
+    write_time: float
+    stalled: bool
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of the uncompressed size to the compressed size."""
+        return self.uncompressed_size / self.compressed_size if self.compressed_size else 1.0
+
+
+@dataclass
+class WriterStats:
+    """Counters and timings of :class:`BlfWriter` instances.
+
+    Pass an instance to :class:`BlfWriter` to collect them. An instance can be shared
+    by several writers to sum up their values. Times are measured with
+    :func:`time.perf_counter` in seconds.
+
+    :ivar containers_written: Number of written LogContainers
+    :ivar uncompressed_size: Size of the uncompressed data of all LogContainers
+    :ivar compressed_size: Size of the data of all LogContainers as stored in the file
+    :ivar compression_time: Time spent compressing
+    :ivar write_time: Time spent writing LogContainers to the file
+    :ivar stall_time: Time that :meth:`BlfWriter.write` was blocked by compressing and
+        writing LogContainers
+    """
+
+    containers_written: int = 0
+    uncompressed_size: int = 0
+    compressed_size: int = 0
+    compression_time: float = 0.0
+    write_time: float = 0.0
+    stall_time: float = 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of the uncompressed size to the compressed size."""
+        return self.uncompressed_size / self.compressed_size if self.compressed_size else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """Uncompressed bytes per second of compressing and writing."""
+        busy_time = self.compression_time + self.write_time
+        return self.uncompressed_size / busy_time if busy_time else 0.0
+
+    def add(self, container_stats: ContainerStats) -> None:
+        """Add the metrics of a LogContainer.
+
+        :param container_stats: Metrics of the LogContainer
+        """
+        self.containers_written += 1
+        self.uncompressed_size += container_stats.uncompressed_size
+        self.compressed_size += container_stats.compressed_size
+        self.compression_time += container_stats.compression_time
+        self.write_time += container_stats.write_time
+        if container_stats.stalled:
+            self.stall_time += container_stats.compression_time + container_stats.write_time
+
+
 class BlfWriter(AbstractContextManager["BlfWriter"]):
     """Binary Log Format (BLF) file writer.
 
@@ -20,7 +110,20 @@ class BlfWriter(AbstractContextManager["BlfWriter"]):
     :param file: Path to BLF file or file-like object
     :param compression_level: Compression level (0-9), defaults to no compression
     :param buffer_size: Size of internal buffer in bytes before flushing, defaults to 128 KiB
+    :param max_latency: Maximum time in seconds that an object may stay in the internal
+        buffer. If set, a background thread flushes the buffer into a (possibly small)
+        container once this time has elapsed, so that readers tailing the file see new
+        objects within a bounded delay. Defaults to ``None`` (flush on buffer size only).
+    :param mode: ``"write"`` creates a new file. ``"append"`` continues an existing file
+        (or creates it, if it does not exist yet): new LogContainers are written after the
+        last complete LogContainer and the file statistics are updated on close. The
+        compression level of the existing file is kept and `compression_level` is ignored.
+    :param stats: If set, the metrics of every written LogContainer are added to it
+    :param on_container: Function that is called with the :class:`ContainerStats` of
+        every written LogContainer. It is called while the writer is locked, possibly
+        from the background thread of `max_latency`, so it should return quickly.
     :raises TypeError: If file parameter is of unsupported type
+    :raises ValueError: If mode is invalid or the file to append to is not a BLF file
     """
 
     def __init__(
@@ -28,6 +131,10 @@ class BlfWriter(AbstractContextManager["BlfWriter"]):
         file: os.PathLike[Any],
         compression_level: Compression = Compression.NONE,
         buffer_size: int = 128 * 1024,
+        max_latency: Optional[float] = None,
+        mode: Literal["write", "append"] = "write",
+        stats: Optional[WriterStats] = None,
+        on_container: Optional[Callable[[ContainerStats], None]] = None,
     ) -> None:
         """Initialize BLF writer.
 
@@ -35,52 +142,208 @@ class BlfWriter(AbstractContextManager["BlfWriter"]):
         """
         self._buffer_size = buffer_size
         self._buffer = bytearray()
-        self._measurement_start_time = time.time()
-        self._time_of_last_object = self._measurement_start_time
+        self._max_latency = max_latency
+        self._stats = stats
+        self._on_container = on_container
+        self._condition = threading.Condition()
+        self._flush_deadline: Optional[float] = None
+        self._latency_thread: Optional[threading.Thread] = None
+        self._time_of_last_object = time.time()
+
+        if mode not in {"write", "append"}:
+            err_msg = f"Unsupported mode {mode!r}"
+            raise ValueError(err_msg)
 
         self._file: BinaryIO
         if isinstance(file, (str, bytes, os.PathLike)):
-            self._file = open(file, "wb")  # noqa: SIM115
+            if mode == "append" and os.path.exists(file):
+                self._file = open(file, "r+b")  # noqa: SIM115
+            else:
+                mode = "write"
+                self._file = open(file, "wb")  # noqa: SIM115
         elif hasattr(file, "write"):
             self._file = file
         else:
             err_msg = f"Unsupported type {type(file)}"
             raise TypeError(err_msg)
 
-        # write file statistics
-        self._file_statistics = FileStatistics.new()
-        self._file_statistics.compression_level = compression_level
-        self._file.write(self._file_statistics.pack())
+        if mode == "append":
+            self._prepare_append()
+        else:
+            # write file statistics
+            self._file_statistics = FileStatistics.new()
+            self._file_statistics.compression_level = compression_level
+            self._file.write(self._file_statistics.pack())
+
+        if max_latency is not None:
+            # make the header visible to readers that tail the file
+            self._file.flush()
+            self._latency_thread = threading.Thread(
+                target=self._flush_on_latency, name="BlfWriter-latency", daemon=True
+            )
+            self._latency_thread.start()
 
     def write(self, obj: ObjectWithHeader[HeaderWithBase]) -> None:
         """Write an object to the BLF file.
 
-        The object is first buffered and only written to disk when the buffer is full
-        or when the file is closed.
+        The object is first buffered and only written to disk when the buffer is full,
+        when `max_latency` has elapsed or when the file is closed.
 
         :param obj: Object to write
         :raises ValueError: If object size doesn't match its header
         """
-        # byte alignment
-        if rest := len(self._buffer) % BYTE_ALIGNMENT:
-            self._buffer.extend(b"\x00" * (BYTE_ALIGNMENT - rest))
         obj_data = obj.pack()
         if len(obj_data) != obj.header.base.object_size:
             err_msg = f"Object size mismatch: {len(obj_data)} != {obj.header.base.object_size}"
             raise ValueError(err_msg)
-        self._buffer.extend(obj_data)
-        self._file_statistics.object_count += 1
-        self._file_statistics.uncompressed_file_size += len(obj_data)
-        self._time_of_last_object = time.time()
 
-        if len(self._buffer) >= self._buffer_size:
-            self._flush_container()
+        with self._condition:
+            # byte alignment
+            if rest := len(self._buffer) % BYTE_ALIGNMENT:
+                self._buffer.extend(b"\x00" * (BYTE_ALIGNMENT - rest))
+            self._buffer.extend(obj_data)
+            self._file_statistics.object_count += 1
+            self._file_statistics.uncompressed_file_size += len(obj_data)
+            self._time_of_last_object = time.time()
+
+            if len(self._buffer) >= self._buffer_size:
+                self._flush_container(stalled=True)
 
-    def _flush_container(self) -> None:
+            if self._max_latency is not None and self._flush_deadline is None and self._buffer:
+                self._flush_deadline = time.monotonic() + self._max_latency
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Write all buffered objects to the file.
+
+        The buffered data is written as one or more LogContainers, even if the buffer
+        is not full yet, and the underlying file is flushed.
+        """
+        with self._condition:
+            while self._buffer:
+                self._flush_container()
+            self._flush_deadline = None
+            self._file.flush()
+
+    def _flush_on_latency(self) -> None:
+        """Flush the buffer whenever its oldest object exceeds `max_latency`.
+
+        Runs in a background thread until the writer is closed.
+        """
+        with self._condition:
+            while not self._file.closed:
+                if self._flush_deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = self._flush_deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self.flush()
+
+    def _prepare_append(self) -> None:
+        """Read the file statistics of an existing file and move behind its last LogContainer.
+
+        If the file was closed properly, its statistics are kept and data after the
+        last LogContainer (e.g. restore points) is removed. Otherwise the file is
+        scanned to recount the objects, an incomplete LogContainer at the end is removed
+        and the last LogContainer is rewritten without a trailing incomplete object.
+        """
+        file_length = self._file.seek(0, os.SEEK_END)
+        self._file.seek(0)
+        reader = BlfReader(self._file)
+        self._file_statistics = reader.file_statistics
+
+        if self._file_statistics.file_size == file_length:
+            end = self._find_end_of_last_container()
+        else:
+            # the file was not closed properly, so the statistics are outdated
+            object_count = 0
+            uncompressed_file_size = FileStatistics.SIZE
+            last_cursor = reader.tell_cursor()
+            for obj in reader:
+                object_count += 1
+                uncompressed_file_size += obj.header.base.object_size
+                last_cursor = reader.tell_cursor()
+            self._file_statistics.object_count = object_count
+            self._file_statistics.uncompressed_file_size = uncompressed_file_size
+
+            end_cursor = reader.tell_cursor()
+            end = end_cursor.container_offset
+            if OBJ_SIGNATURE in end_cursor.carry_over:
+                # the last object is incomplete, rewrite the LogContainer where it starts
+                end = self._truncate_container(
+                    last_cursor.container_offset,
+                    last_cursor.object_offset - len(last_cursor.carry_over),
+                )
+
+        self._time_of_last_object = _to_timestamp(self._file_statistics.last_object_time)
+        self._file_statistics.restore_points_offset = 0
+        self._file.seek(end)
+        self._file.truncate()
+        self._file_statistics.file_size = end
+
+    def _find_end_of_last_container(self) -> int:
+        """Find the end offset of the last complete LogContainer.
+
+        Only the object headers are read, the data is skipped.
+
+        :returns: File offset behind the last complete LogContainer
+        """
+        file_length = self._file.seek(0, os.SEEK_END)
+        restore_points_offset = self._file_statistics.restore_points_offset or file_length
+        offset = end = FileStatistics.SIZE
+        while offset < restore_points_offset:
+            self._file.seek(offset)
+            header_base_data = self._file.read(ObjectHeaderBase.SIZE)
+            if len(header_base_data) < ObjectHeaderBase.SIZE:
+                break
+            if not header_base_data.startswith(OBJ_SIGNATURE):
+                # skip padding byte
+                offset += 1
+                continue
+            header_base = ObjectHeaderBase.unpack(header_base_data)
+            if (
+                header_base.object_size < ObjectHeaderBase.SIZE
+                or offset + header_base.object_size > file_length
+            ):
+                break
+            offset += header_base.object_size
+            if header_base.object_type is ObjType.LOG_CONTAINER:
+                end = offset
+        return end
+
+    def _truncate_container(self, offset: int, data_size: int) -> int:
+        """Rewrite a LogContainer with only the first bytes of its uncompressed data.
+
+        :param offset: File offset of the LogContainer
+        :param data_size: Number of uncompressed bytes to keep
+        :returns: File offset behind the rewritten LogContainer
+        """
+        if data_size <= 0:
+            return offset
+        self._file.seek(offset)
+        header_base = ObjectHeaderBase.unpack(self._file.read(ObjectHeaderBase.SIZE))
+        self._file.seek(offset)
+        container = LogContainer.unpack(self._file.read(header_base.object_size))
+        data = container.data
+        if (
+            container.header.compression_method == CompressionMethod.ZLIB_DEFLATE
+            and self._file_statistics.compression_level > 0
+        ):
+            data = zlib.decompress(data)
+        log_container = self._new_container(data[:data_size])
+        self._file.seek(offset)
+        self._file.write(log_container.pack())
+        return self._file.tell()
+
+    def _flush_container(self, stalled: bool = False) -> None:
         """Flush the internal buffer to disk.
 
         Creates a LogContainer with the buffered data and writes it to the file.
         Handles compression if enabled.
+
+        :param stalled: `True` if a call of :meth:`write` waits for the LogContainer
         """
         if not self._buffer:
             return
@@ -91,18 +354,44 @@ class BlfWriter(AbstractContextManager["BlfWriter"]):
 
         buffer, self._buffer = self._buffer[: self._buffer_size], self._buffer[self._buffer_size :]
 
-        if self._file_statistics.compression_level > Compression.NONE:
-            compressed_data = zlib.compress(buffer, level=self._file_statistics.compression_level)
-        else:
-            compressed_data = bytes(buffer)
-
-        log_container = LogContainer.new(
-            data=compressed_data,
-            time_stamp=round((time.time() - self._measurement_start_time) * 1e9),
-            flags=ObjFlags.TIME_ONE_NANS,
-        )
+        offset = self._file.tell()
+        start = time.perf_counter()
+        log_container = self._new_container(buffer)
+        compressed = time.perf_counter()
         self._file.write(log_container.pack())
+        written = time.perf_counter()
         self._file_statistics.file_size = self._file.tell()
+        if self._stats is None and self._on_container is None:
+            return
+
+        container_stats = ContainerStats(
+            offset=offset,
+            uncompressed_size=len(buffer),
+            compressed_size=len(log_container.data),
+            compression_method=log_container.header.compression_method,
+            compression_time=compressed - start,
+            write_time=written - compressed,
+            stalled=stalled,
+        )
+        if self._stats is not None:
+            self._stats.add(container_stats)
+        if self._on_container is not None:
+            self._on_container(container_stats)
+
+    def _new_container(self, data: Union[bytes, bytearray]) -> LogContainer:
+        """Create a LogContainer and compress its data, if compression is enabled.
+
+        Data that does not get smaller, e.g. already compressed Ethernet payloads,
+        is stored uncompressed.
+
+        :param data: Uncompressed data
+        :returns: The LogContainer
+        """
+        if self._file_statistics.compression_level > Compression.NONE:
+            compressed_data = zlib.compress(data, level=self._file_statistics.compression_level)
+            if len(compressed_data) < len(data):
+                return LogContainer.new(compressed_data, CompressionMethod.ZLIB_DEFLATE, len(data))
+        return LogContainer.new(bytes(data), CompressionMethod.NONE, len(data))
 
     def _update_file_statistics(self) -> None:
         """Update file statistics and write them to the beginning of the file.
@@ -120,11 +409,16 @@ class BlfWriter(AbstractContextManager["BlfWriter"]):
 
         Flushes any remaining buffered data and updates file statistics before closing.
         """
-        if not self._file.closed:
+        with self._condition:
+            if self._file.closed:
+                return
             while self._buffer:
                 self._flush_container()
             self._update_file_statistics()
             self._file.close()
+            self._condition.notify()
+        if self._latency_thread is not None:
+            self._latency_thread.join()
 
     def __enter__(self) -> "BlfWriter":
         """Enter context manager.
@@ -141,3 +435,12 @@ class BlfWriter(AbstractContextManager["BlfWriter"]):
         :param traceback: Traceback if an exception occurred
         """
         self.close()
+
+
+def _to_timestamp(system_time: SystemTime) -> float:
+    """Convert a UTC SystemTime to a POSIX timestamp.
+
+    :param system_time: SystemTime in UTC
+    :returns: POSIX timestamp in seconds
+    """
+    return system_time.to_datetime().replace(tzinfo=datetime.timezone.utc).timestamp()
@@ -0,0 +1,65 @@
+import tempfile
+import threading
+from pathlib import Path
+
+from tests.test_reader import _write_blf
+from vblf.cache import ContainerCache
+from vblf.constants import Compression
+from vblf.reader import BlfReader
+
+
+def test_container_cache():
+    cache = ContainerCache(max_size=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"5678")
+    assert cache.get("a") == b"1234"
+
+    # least recently used entry is evicted
+    cache.put("c", b"901")
+    assert cache.size == 7
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"901"
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    # too large for cache
+    cache.put("d", b"12345678901")
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+    cache.clear()
+    assert cache.size == 0
+    assert len(cache) == 0
+
+
+def test_shared_cache():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 500, Compression.DEFAULT)
+
+        cursors = []
+        with BlfReader(path) as reader:
+            while reader.read_object() is not None:
+                cursors.append(reader.tell_cursor())
+
+        cache = ContainerCache()
+        results: dict[int, list] = {}
+
+        def read(index: int) -> None:
+            # jump back and forth between cursors
+            result = []
+            for i in range(index, len(cursors) - 1, 7):
+                with BlfReader.from_cursor(path, cursors[i], cache=cache) as reader:
+                    result.append(reader.read_object())
+            results[index] = result
+
+        threads = [threading.Thread(target=read, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index, result in results.items():
+            assert result == objects[index + 1 :: 7][: len(result)]
+            assert len(result) == len(range(index, len(cursors) - 1, 7))
+        assert cache.hits > cache.misses
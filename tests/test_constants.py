@@ -0,0 +1,46 @@
+import pytest
+
+from vblf.constants import (
+    APP_TEXT_SOURCES,
+    CAN_FD_FLAGS,
+    OBJ_FLAGS,
+    OBJ_TYPES,
+    SYS_VAR_TYPES,
+    TRIGGER_FLAGS,
+    AppTextSource,
+    CanFdFlags,
+    DecodingTable,
+    ObjFlags,
+    ObjType,
+    SysVarType,
+    TriggerFlag,
+)
+
+
+def test_decoding_table():
+    for value in (0, 1, 10, 128):
+        assert OBJ_TYPES[value] is ObjType(value)
+    assert OBJ_TYPES[1000] is ObjType.UNKNOWN
+    assert ObjType.from_int(1000) is ObjType.UNKNOWN
+
+    assert OBJ_FLAGS[2] is ObjFlags.TIME_ONE_NANS
+    assert TRIGGER_FLAGS[0] == TriggerFlag.SINGLE_TRIGGER
+
+    # combined flags are added on first lookup
+    value = CanFdFlags.FDF | CanFdFlags.BRS
+    assert int(value) not in CAN_FD_FLAGS
+    assert CAN_FD_FLAGS[int(value)] == value
+    assert type(CAN_FD_FLAGS[int(value)]) is CanFdFlags
+    assert int(value) in CAN_FD_FLAGS
+
+    assert SYS_VAR_TYPES[3] is SysVarType.STRING
+    assert APP_TEXT_SOURCES[2] is AppTextSource.METADATA
+    with pytest.raises(ValueError):
+        _ = SYS_VAR_TYPES[100]
+
+
+def test_decoding_table_size():
+    table = DecodingTable(ObjFlags)
+    for value in range(10_000):
+        assert table[value] == ObjFlags(value)
+    assert len(table) <= 4096
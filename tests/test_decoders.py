@@ -0,0 +1,40 @@
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from vblf.constants import ObjType
+from vblf.decoders import load_decoders
+
+
+def _write_plugin(directory: Path, entry_points: str) -> None:
+    (directory / "vblf_test_plugin.py").write_text("def decode(data):\n    return len(data)\n")
+    dist_info = directory / "vblf_test_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: vblf-test-plugin\n")
+    (dist_info / "entry_points.txt").write_text(entry_points)
+
+
+def test_load_decoders(monkeypatch: pytest.MonkeyPatch):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write_plugin(
+            Path(temp_dir),
+            "[vblf.decoders]\n"
+            "CAN_FD_MESSAGE_64 = vblf_test_plugin:decode\n"
+            "0x56 = vblf_test_plugin:decode\n",
+        )
+        monkeypatch.syspath_prepend(temp_dir)
+        decoders = load_decoders()
+        assert set(decoders) == {ObjType.CAN_FD_MESSAGE_64, ObjType.CAN_MESSAGE2}
+        assert decoders[ObjType.CAN_FD_MESSAGE_64](b"12345678") == 8
+        assert load_decoders("vblf.other") == {}
+        sys.modules.pop("vblf_test_plugin", None)
+
+
+def test_load_decoders_invalid_name(monkeypatch: pytest.MonkeyPatch):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _write_plugin(Path(temp_dir), "[vblf.decoders]\nCAN_FOO = vblf_test_plugin:decode\n")
+        monkeypatch.syspath_prepend(temp_dir)
+        with pytest.raises(ValueError, match="CAN_FOO"):
+            load_decoders()
@@ -0,0 +1,227 @@
+import io
+import struct
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from tests import DATA_DIR
+from vblf.can import CanErrorFrame, CanMessage
+from vblf.constants import OBJ_SIGNATURE, Compression, ObjType
+from vblf.general import NotImplementedObject, ObjectHeaderBase
+from vblf.indexing import (
+    FRAME_ID_OFFSETS,
+    BlfIndex,
+    ContainerIndex,
+    FrameIdIndex,
+    build_frame_id_index,
+    build_index,
+    iter_objects,
+    iter_objects_at,
+)
+from vblf.reader import OBJ_MAP, BlfReader
+from vblf.writer import BlfWriter
+
+
+def test_frame_id_offsets():
+    for object_type, offset in FRAME_ID_OFFSETS.items():
+        obj_data = (DATA_DIR / f"{ObjType(object_type).name}.lobj").read_bytes()
+        base = ObjectHeaderBase.unpack_from(obj_data)
+        obj_class = OBJ_MAP[base.object_type]
+        assert obj_class is not None
+        obj = obj_class.unpack(obj_data)
+        assert int.from_bytes(obj_data[offset : offset + 4], "little") == obj.frame_id
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_build_index(compression_level: Compression):
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    objects = []
+    for i in range(2000):
+        obj = CanMessage.unpack(raw)
+        obj.header.object_time_stamp = i * 1000
+        obj.frame_id = i // 100
+        obj.channel = i % 4
+        objects.append(obj)
+    objects.append(CanErrorFrame.unpack((DATA_DIR / "CAN_ERROR.lobj").read_bytes()))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path, compression_level=compression_level, buffer_size=1000) as writer:
+            for obj in objects:
+                writer.write(obj)
+        with BlfReader(path) as reader:
+            objects = list(reader)
+
+        index = build_index(path)
+        assert index.file_size == path.stat().st_size
+        assert len(index.containers) > 10
+        assert sum(container.object_count for container in index.containers) == len(objects)
+        assert list(iter_objects(path, index.containers)) == objects
+        assert BlfIndex.unpack(index.pack()) == index
+
+        # query by frame id, channel and time
+        containers = index.select(frame_ids=[5], channels=[2], start_time=520_000)
+        assert 0 < len(containers) < len(index.containers) / 4
+        selected = [
+            obj
+            for obj in iter_objects(path, containers)
+            if isinstance(obj, CanMessage)
+            and obj.frame_id == 5
+            and obj.channel == 2
+            and obj.header.object_time_stamp >= 520_000
+        ]
+        assert selected == objects[522:600:4]
+
+        containers = index.select(object_types=[ObjType.CAN_ERROR])
+        assert len(containers) == 1
+        assert objects[-1] in list(iter_objects(path, containers))
+
+        # file-like object
+        with path.open("rb") as f:
+            assert build_index(io.BytesIO(f.read())) == index
+
+
+def test_select_without_time_stamps():
+    # LogContainer whose objects are too short for a time stamp
+    container = ContainerIndex(144, 64, ObjType.LOG_CONTAINER, 24, 0, 1, None, None, {0x20})
+    index = BlfIndex(208, [container])
+    assert index.select() == [container]
+    assert index.select(object_types=[0x20]) == [container]
+    assert index.select(object_types=[ObjType.CAN_MESSAGE]) == []
+    assert index.select(start_time=0) == []
+    assert index.select(stop_time=0) == []
+
+
+def test_large_time_stamp():
+    # the time stamp in 10 µs units exceeds 64 bits in nanoseconds
+    obj_data = (DATA_DIR / "TRIGGER_CONDITION.lobj").read_bytes()
+    obj_class = OBJ_MAP[ObjectHeaderBase.unpack_from(obj_data).object_type]
+    assert obj_class is not None
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path) as writer:
+            writer.write(obj_class.unpack(obj_data))
+        index = build_index(path)
+
+    (container,) = index.containers
+    assert container.min_time_stamp == container.max_time_stamp == 2**64 - 2
+    assert BlfIndex.unpack(index.pack()) == index
+    assert index.select(start_time=2**63) == [container]
+    assert index.select(stop_time=2**63) == []
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_frame_id_index(compression_level: Compression):
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    objects = []
+    for i in range(3000):
+        obj = CanMessage.unpack(raw)
+        obj.header.object_time_stamp = i
+        obj.frame_id = i % 7
+        obj.channel = i % 3
+        objects.append(obj)
+    # very large object that spans several LogContainers
+    large_object = CanMessage.unpack(raw)
+    large_object.frame_id = 100
+    large_object_data = bytearray(large_object.pack() + bytes(4000 - len(raw)))
+    struct.pack_into("I", large_object_data, 8, len(large_object_data))
+    objects.insert(1500, NotImplementedObject.unpack(bytes(large_object_data)))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path, compression_level=compression_level, buffer_size=1000) as writer:
+            for obj in objects:
+                writer.write(obj)
+        with BlfReader(path) as reader:
+            objects = list(reader)
+
+        frame_id_index = build_frame_id_index(path)
+        assert len(frame_id_index.positions) == 22
+        assert FrameIdIndex.unpack(frame_id_index.pack()) == frame_id_index
+        # delta encoding needs less than 4 bytes per position
+        assert len(frame_id_index.pack()) < 4 * 3000
+
+        for channel, frame_id in [(0, 0), (2, 5), (1, 3), (0x1111, 100)]:
+            positions = frame_id_index.get(channel, frame_id)
+            expected = [
+                obj
+                for obj in objects
+                if isinstance(obj, CanMessage)
+                and obj.channel == channel
+                and obj.frame_id == frame_id
+            ]
+            assert len(positions) == len(expected)
+            assert list(iter_objects_at(path, positions)) == expected
+        assert frame_id_index.get(5, 5) == []
+
+        # build in parallel
+        index = build_index(path)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert build_frame_id_index(path, index, executor, chunk_size=5) == frame_id_index
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_straddling_first_object(compression_level: Compression):
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    objects = []
+    for i in range(43):
+        obj = CanMessage.unpack(raw)
+        obj.header.object_time_stamp = i
+        obj.frame_id = i % 5
+        objects.append(obj)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        # LogContainers are smaller than two objects, so that many of them begin with
+        # the end of one object followed by an object that continues in the next one
+        with BlfWriter(path, compression_level=compression_level, buffer_size=64) as writer:
+            for obj in objects:
+                writer.write(obj)
+
+        index = build_index(path)
+        assert any(
+            container.object_count == 1 and container.first_object_offset < container.data_size
+            for container in index.containers
+        )
+        assert sum(container.object_count for container in index.containers) == len(objects)
+        assert list(iter_objects(path, index.containers)) == objects
+        for container in index.containers:
+            assert len(list(iter_objects(path, [container]))) == container.object_count
+
+        # chunks that begin with a straddling object
+        frame_id_index = build_frame_id_index(path)
+        assert sum(len(positions) for positions in frame_id_index.positions.values()) == 2 * 43
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for chunk_size in (1, 2, 3):
+                assert build_frame_id_index(path, index, executor, chunk_size) == frame_id_index
+
+
+def test_short_objects():
+    can_message = CanMessage.unpack((DATA_DIR / "CAN_MESSAGE.lobj").read_bytes())
+    # objects with a CAN message type that end before their time stamp or frame id
+    short_objects = [
+        NotImplementedObject.unpack(
+            ObjectHeaderBase(OBJ_SIGNATURE, 16, 1, size, ObjType.CAN_MESSAGE).pack()
+            + bytes(size - ObjectHeaderBase.SIZE)
+        )
+        for size in (24, 32, 36)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path) as writer:
+            for obj in short_objects:
+                writer.write(obj)
+            writer.write(can_message)
+
+        index = build_index(path)
+        (container,) = index.containers
+        assert container.object_count == 4
+        assert container.channels == {0, can_message.channel}
+        assert container.min_time_stamp == 0
+
+        frame_id_index = build_frame_id_index(path)
+        assert list(frame_id_index.positions) == [(can_message.channel, can_message.frame_id)]
@@ -0,0 +1,66 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from tests import DATA_DIR
+from vblf.can import CanMessage
+from vblf.constants import Compression
+from vblf.general import HeaderWithBase, NotImplementedObject, ObjectHeaderBase
+from vblf.lazy import LazyObject
+from vblf.reader import OBJ_MAP, BlfReader
+from vblf.writer import BlfWriter
+
+
+@pytest.mark.parametrize("path", sorted(DATA_DIR.glob("*.lobj")), ids=lambda path: path.stem)
+def test_lazy_object(path: Path):
+    buffer = path.read_bytes()
+    base = ObjectHeaderBase.unpack_from(buffer)
+    obj_class = OBJ_MAP.get(base.object_type) or NotImplementedObject
+    obj = obj_class.unpack(buffer)
+
+    lazy_obj = LazyObject(obj_class, buffer)
+    assert lazy_obj._object is None
+    assert lazy_obj.header == obj.header
+    assert lazy_obj.pack() == buffer
+    assert lazy_obj._object is None
+
+    assert lazy_obj.decode() == obj
+    assert lazy_obj == obj
+    assert lazy_obj.object_class is obj_class
+    for name in vars(obj):
+        assert getattr(lazy_obj, name) == getattr(obj, name)
+
+
+def test_lazy_reader():
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path, compression_level=Compression.DEFAULT) as writer:
+            for i in range(100):
+                obj = CanMessage.unpack(raw)
+                obj.header.object_time_stamp = i
+                obj.frame_id = i
+                writer.write(obj)
+        with BlfReader(path) as reader:
+            objects = list(reader)
+
+        with BlfReader(path, lazy=True) as reader:
+            lazy_objects = list(reader)
+        assert all(isinstance(obj, LazyObject) for obj in lazy_objects)
+        assert [obj.header.object_time_stamp for obj in lazy_objects] == list(range(100))
+        assert all(obj._object is None for obj in lazy_objects)
+        assert [obj.frame_id for obj in lazy_objects] == list(range(100))
+        assert lazy_objects == objects
+
+        with BlfReader(path, lazy=True) as reader:
+            assert reader.tail(3) == objects[-3:]
+
+
+def test_lazy_not_implemented_object():
+    buffer = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    lazy_obj = LazyObject(NotImplementedObject, buffer)
+    assert type(lazy_obj.header) is HeaderWithBase
+    assert lazy_obj.buffer == buffer
+    with pytest.raises(AttributeError):
+        _ = lazy_obj.missing
@@ -0,0 +1,60 @@
+import datetime
+import tempfile
+from pathlib import Path
+
+from tests import DATA_DIR
+from vblf.can import CanMessage
+from vblf.constants import Compression
+from vblf.general import FileStatistics, SystemTime
+from vblf.merge import iter_merged
+from vblf.writer import BlfWriter
+
+
+def _write_blf(path: Path, start: datetime.datetime, time_stamps: list[int]) -> None:
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    with BlfWriter(path, compression_level=Compression.SPEED, buffer_size=1024) as writer:
+        for time_stamp in time_stamps:
+            obj = CanMessage.unpack(raw)
+            obj.header.object_time_stamp = time_stamp
+            writer.write(obj)
+
+    # set measurement start time
+    data = bytearray(path.read_bytes())
+    file_statistics = FileStatistics.unpack(data[: FileStatistics.SIZE])
+    file_statistics.measurement_start_time = SystemTime.from_datetime(start)
+    data[: FileStatistics.SIZE] = file_statistics.pack()
+    path.write_bytes(data)
+
+
+def test_iter_merged():
+    start = datetime.datetime(2025, 1, 1, 12, 0, 0)
+    epoch_ns = round(start.replace(tzinfo=datetime.timezone.utc).timestamp()) * 10**9
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path_a = Path(temp_dir) / "a.blf"
+        path_b = Path(temp_dir) / "b.blf"
+        # file b starts one second later
+        _write_blf(path_a, start, [i * 10**8 for i in range(0, 100, 2)])
+        _write_blf(path_b, start + datetime.timedelta(seconds=1), [i * 10**8 for i in range(90)])
+
+        merged = list(iter_merged([path_a, path_b], read_ahead=7))
+
+    time_stamps = [time_stamp for time_stamp, _, _ in merged]
+    assert len(merged) == 50 + 90
+    assert time_stamps == sorted(time_stamps)
+    assert time_stamps[0] == epoch_ns
+    assert time_stamps[-1] == epoch_ns + 10**9 + 89 * 10**8
+    assert [index for _, index, _ in merged[:7]] == [0] * 6 + [1]
+    for time_stamp, index, obj in merged:
+        offset = epoch_ns + index * 10**9
+        assert time_stamp == offset + obj.header.object_time_stamp
+
+
+def test_iter_merged_stop_early():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "a.blf"
+        _write_blf(path, datetime.datetime(2025, 1, 1), list(range(1000)))
+
+        merged = iter_merged([path, path], read_ahead=10)
+        assert len([next(merged) for _ in range(5)]) == 5
+        merged.close()
@@ -0,0 +1,689 @@
+import gzip
+import io
+import itertools
+import mmap
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests import DATA_DIR
+from vblf.can import CanFdMessage64, CanMessage
+from vblf.constants import OBJ_SIGNATURE, Compression, ObjType
+from vblf.general import FileStatistics, NotImplementedObject, ObjectHeader, ObjectHeaderBase
+from vblf.indexing import build_index
+from vblf.reader import (
+    OBJ_MAP,
+    BlfReader,
+    BlfSequenceReader,
+    ReaderCursor,
+    ReaderStats,
+    _get_bulk_decoder,
+)
+from vblf.writer import BlfWriter
+
+
+def _write_blf(path: Path, count: int, compression_level: Compression = Compression.NONE) -> list:
+    objects = []
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    with BlfWriter(path, compression_level=compression_level, buffer_size=1024) as writer:
+        for i in range(count):
+            obj = CanMessage.unpack(raw)
+            obj.header.object_time_stamp = i
+            writer.write(obj)
+            objects.append(obj)
+    return objects
+
+
+def test_follow():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_file = Path(temp_dir) / "source.blf"
+        objects = _write_blf(source_file, 200, Compression.DEFAULT)
+        source_data = source_file.read_bytes()
+
+        # copy the file in small chunks to simulate a growing file
+        growing_file = Path(temp_dir) / "growing.blf"
+        growing_file.write_bytes(source_data[:1000])
+
+        def grow() -> None:
+            with growing_file.open("ab") as f:
+                for start in range(1000, len(source_data), 97):
+                    f.write(source_data[start : start + 97])
+                    f.flush()
+                    time.sleep(0.001)
+
+        thread = threading.Thread(target=grow)
+        thread.start()
+        with BlfReader(growing_file, follow=True, poll_interval=0.001) as reader:
+            followed_objects = list(itertools.islice(reader, len(objects)))
+        thread.join()
+
+    assert followed_objects == objects
+
+
+def test_follow_prefetch_close():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 200, Compression.DEFAULT)
+
+        # the read-ahead thread polls for data at the end of the file until it is closed
+        reader = BlfReader(path, follow=True, prefetch_size=1 << 24)
+        assert list(itertools.islice(reader, 100)) == objects[:100]
+        thread = threading.Thread(target=reader.close, daemon=True)
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not any(t.name == "BlfReader-read-ahead" for t in threading.enumerate())
+
+
+def test_cursor():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 300, Compression.DEFAULT)
+
+        for stop in (0, 1, 35, 36, 150, 299, 300):
+            with BlfReader(path) as reader:
+                head = list(itertools.islice(reader, stop))
+                cursor = ReaderCursor.unpack(reader.tell_cursor().pack())
+            with BlfReader.from_cursor(path, cursor) as reader:
+                tail = list(reader)
+            assert head + tail == objects
+
+
+def test_cursor_growing_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_file = Path(temp_dir) / "source.blf"
+        objects = _write_blf(source_file, 300, Compression.NONE)
+        source_data = source_file.read_bytes()
+
+        growing_file = Path(temp_dir) / "growing.blf"
+        growing_file.write_bytes(source_data[:5000])
+        with BlfReader(growing_file) as reader:
+            head = list(reader)
+            cursor = reader.tell_cursor()
+        assert head == objects[: len(head)]
+        assert cursor.carry_over
+
+        growing_file.write_bytes(source_data)
+        with BlfReader.from_cursor(growing_file, cursor) as reader:
+            tail = list(reader)
+        assert head + tail == objects
+
+
+def _split_blf(path: Path, directory: Path, count: int) -> list[Path]:
+    """Split a BLF file at LogContainer boundaries into `count` files."""
+    data = path.read_bytes()
+    header = data[: FileStatistics.SIZE]
+    offsets = []
+    offset = FileStatistics.SIZE
+    while (offset := data.find(OBJ_SIGNATURE, offset)) != -1:
+        offsets.append(offset)
+        offset += ObjectHeaderBase.unpack_from(data, offset).object_size
+    offsets.append(len(data))
+
+    paths = []
+    step = (len(offsets) - 1) // count
+    for i in range(count):
+        start = offsets[i * step]
+        end = offsets[(i + 1) * step] if i < count - 1 else len(data)
+        split_path = directory / f"log_{i + 1}.blf"
+        split_path.write_bytes(header + data[start:end])
+        paths.append(split_path)
+    return paths
+
+
+@pytest.mark.parametrize("prefetch_size", [1, 16 * 1024 * 1024])
+def test_sequence_reader(prefetch_size: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 500, Compression.DEFAULT)
+        split_dir = Path(temp_dir) / "split"
+        split_dir.mkdir()
+        paths = _split_blf(path, split_dir, 11)
+
+        # objects straddle the file boundaries
+        with BlfReader(paths[0]) as reader:
+            assert len(list(reader)) < len(objects) / 11
+            assert reader.tell_cursor().carry_over
+
+        with BlfSequenceReader(paths, prefetch_size=prefetch_size) as reader:
+            assert list(reader) == objects
+
+        # natural sort order of directory content
+        with BlfSequenceReader(split_dir, prefetch_size=prefetch_size) as reader:
+            assert reader.read_object() == objects[0]
+            assert reader.file_statistics is not None
+            assert list(reader) == objects[1:]
+            assert reader.read_object() is None
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+@pytest.mark.parametrize("buffer_type", ["bytes", "bytearray", "memoryview", "mmap"])
+def test_buffer(compression_level: Compression, buffer_type: str):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 200, compression_level)
+
+        with path.open("rb") as f:
+            data = f.read()
+            buffer: Any
+            if buffer_type == "bytes":
+                buffer = data
+            elif buffer_type == "bytearray":
+                buffer = bytearray(data)
+            elif buffer_type == "memoryview":
+                buffer = memoryview(data)
+            else:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            with BlfReader(buffer) as reader:
+                assert reader.file_statistics.object_count == 200
+                assert [reader.read_object() for _ in range(50)] == objects[:50]
+                cursor = reader.tell_cursor()
+
+            with BlfReader.from_cursor(buffer, cursor) as reader:
+                assert list(reader) == objects[50:]
+
+            if isinstance(buffer, mmap.mmap):
+                # all exported buffers were released on close
+                buffer.close()
+
+
+class _ReadOnlyStream:
+    """Non-seekable stream that returns few bytes per read."""
+
+    def __init__(self, data: bytes) -> None:
+        self._stream = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(min(size, 100))
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_stream(compression_level: Compression):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 200, compression_level)
+        data = path.read_bytes()
+
+        gzip_path = Path(temp_dir) / "test.blf.gz"
+        gzip_path.write_bytes(gzip.compress(data))
+        with BlfReader(gzip.open(gzip_path, "rb")) as reader:
+            assert list(reader) == objects
+
+        with BlfReader(_ReadOnlyStream(data)) as reader:  # type: ignore[arg-type]
+            assert list(reader) == objects
+
+        read_fd, write_fd = os.pipe()
+
+        def write_pipe() -> None:
+            with open(write_fd, "wb", buffering=0) as f:
+                for i in range(0, len(data), 1000):
+                    f.write(data[i : i + 1000])
+                    time.sleep(0.001)
+
+        thread = threading.Thread(target=write_pipe)
+        thread.start()
+        with BlfReader(open(read_fd, "rb")) as reader:
+            assert list(reader) == objects
+        thread.join()
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_prefetch(compression_level: Compression):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 500, compression_level)
+
+        with BlfReader(path, prefetch_size=2048) as reader:
+            assert [reader.read_object() for _ in range(100)] == objects[:100]
+            cursor = reader.tell_cursor()
+            assert list(reader) == objects[100:]
+
+        with BlfReader.from_cursor(path, cursor, prefetch_size=2048) as reader:
+            assert list(reader) == objects[100:]
+
+        # stop reading early
+        with BlfReader(path, prefetch_size=2048) as reader:
+            assert reader.read_object() == objects[0]
+
+        # the read-ahead thread is stopped on close, so that the mmap can be closed
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with BlfReader(mm, prefetch_size=2048) as reader:
+                assert reader.read_object() == objects[0]
+            assert not any(t.name == "BlfReader-read-ahead" for t in threading.enumerate())
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_iter_reverse(compression_level: Compression):
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    # object that spans several LogContainers
+    large_object_data = bytearray(raw + b"LOBJ" * 1000)
+    struct.pack_into("I", large_object_data, 8, len(large_object_data))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path, compression_level=compression_level, buffer_size=1000) as writer:
+            for i in range(1000):
+                obj = CanMessage.unpack(raw)
+                obj.header.object_time_stamp = i
+                writer.write(obj)
+                if i == 500:
+                    writer.write(NotImplementedObject.unpack(bytes(large_object_data)))
+        with BlfReader(path) as reader:
+            objects = list(reader)
+        assert len(objects) == 1001
+
+        with BlfReader(path) as reader:
+            assert reader.read_object() == objects[0]
+            assert list(reader.iter_reverse()) == objects[::-1]
+            assert reader.tail(10) == objects[-10:]
+            assert reader.tail(2000) == objects
+            # forward iteration is not affected
+            assert reader.read_object() == objects[1]
+
+        with BlfReader(path.read_bytes()) as reader:
+            assert list(reader.iter_reverse()) == objects[::-1]
+
+        # file with incomplete LogContainer at the end
+        data = path.read_bytes()
+        for torn_bytes in (10, 300):
+            with BlfReader(data[:-torn_bytes]) as reader:
+                expected = list(reader)
+            with BlfReader(data[:-torn_bytes]) as reader:
+                assert reader.tail(50) == expected[-50:]
+
+        # torn header of the next LogContainer or padding at the end
+        for trailing_data in (b"LOBJ" + bytes(6), b"LOBJ" + bytes(11), bytes(16)):
+            with BlfReader(data + trailing_data) as reader:
+                assert reader.tail(5) == objects[-5:]
+
+
+def test_iter_reverse_prefetch():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 20_000, Compression.DEFAULT)
+
+        # the read-ahead thread reads the file while the LogContainers at the end are read
+        with BlfReader(path, prefetch_size=1 << 12) as reader:
+            read_objects = []
+            for i, obj in enumerate(reader):
+                read_objects.append(obj)
+                if i % 1000 == 0:
+                    assert reader.tail(5) == objects[-5:]
+        assert read_objects == objects
+
+
+def test_iter_reverse_object_header_size():
+    # LogContainers of Vector and python-can have a header size of 16
+    container_data = (DATA_DIR / "LOG_CONTAINER.lobj").read_bytes()
+    assert ObjectHeaderBase.unpack_from(container_data).header_size == ObjectHeaderBase.SIZE
+    data = FileStatistics.new().pack() + container_data
+    with BlfReader(data) as reader:
+        objects = list(reader)
+    assert objects
+    with BlfReader(data) as reader:
+        assert list(reader.iter_reverse()) == objects[::-1]
+        assert reader.tail(2) == objects
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_skip(compression_level: Compression):
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    # object that spans several LogContainers
+    large_object_data = bytearray(raw + b"LOBJ" * 1000)
+    struct.pack_into("I", large_object_data, 8, len(large_object_data))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path, compression_level=compression_level, buffer_size=1000) as writer:
+            for i in range(1000):
+                obj = CanMessage.unpack(raw)
+                obj.header.object_time_stamp = i
+                writer.write(obj)
+                if i == 500:
+                    writer.write(NotImplementedObject.unpack(bytes(large_object_data)))
+        with BlfReader(path) as reader:
+            objects = list(reader)
+        index = build_index(path)
+
+        for file_index in (None, index):
+            # paging
+            with BlfReader(path) as reader:
+                assert reader.skip(0, file_index) == 0
+                assert reader.head(3) == objects[:3]
+                assert reader.skip(490, file_index) == 490
+                assert reader.head(10) == objects[493:503]
+                assert reader.skip(1, file_index) == 1
+                assert reader.read_object() == objects[504]
+                assert reader.skip(2000, file_index) == 496
+                assert reader.head(10) == []
+
+            for count in (1, 7, 100, 499, 500, 501, 502, 1000, 1001):
+                with BlfReader(path) as reader:
+                    assert reader.skip(count, file_index) == count
+                    assert reader.head(2) == objects[count : count + 2]
+
+
+def test_skip_truncated_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        _write_blf(path, 100)
+        with BlfReader(path) as reader:
+            containers = list(reader.iter_containers())
+        # the last complete LogContainer ends with the start of an object
+        assert containers[-2].uncompressed_size % 48
+        with path.open("r+b") as f:
+            f.truncate(containers[-1].offset + containers[-1].object_size // 2)
+        with BlfReader(path) as reader:
+            objects = list(reader)
+        assert len(objects) < 100
+        index = build_index(path)
+
+        for count in range(len(objects) + 1):
+            with BlfReader(path) as reader:
+                assert reader.skip(count) == count
+                assert reader.skip(1000, index) == len(objects) - count
+            with BlfReader(path) as reader:
+                assert reader.skip(count, index) == count
+                assert reader.head(2) == objects[count : count + 2]
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_iter_containers(compression_level: Compression):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        _write_blf(path, 500, compression_level)
+        index = build_index(path)
+
+        with BlfReader(path) as reader:
+            containers = list(reader.iter_containers())
+        assert [info.offset for info in containers] == [c.offset for c in index.containers]
+        assert [info.compressed_size for info in containers] == [
+            c.object_size - ObjectHeader.SIZE for c in index.containers
+        ]
+        assert [info.uncompressed_size for info in containers] == [
+            c.data_size for c in index.containers
+        ]
+        assert containers[-1].end_offset == path.stat().st_size
+        assert all(info.compressed == bool(compression_level) for info in containers)
+        if compression_level:
+            # the uncompressed size of the LogContainer header is used without decompressing
+            assert (
+                replace(containers[0], data=b"x").uncompressed_size
+                == containers[0].uncompressed_size
+            )
+
+        # truncated file
+        data = path.read_bytes()
+        with BlfReader(data[:-10]) as reader:
+            truncated = list(reader.iter_containers())
+        assert truncated == containers[:-1]
+        assert truncated[-1].end_offset < len(data) - 10
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_legacy_container_header(compression_level: Compression):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 200, compression_level)
+
+        # older versions wrote object flags and a time stamp into the LogContainer header
+        data = bytearray(path.read_bytes())
+        with BlfReader(bytes(data)) as reader:
+            containers = list(reader.iter_containers())
+        for info in containers:
+            struct.pack_into("IIQ", data, info.offset + 16, 2, 0, 0xFFFF_FFFF_FFFF_FFFF)
+        with BlfReader(data) as reader:
+            assert list(reader) == objects
+        with BlfReader(data) as reader:
+            # the uncompressed size is not plausible, so the data is decompressed
+            assert [info.uncompressed_size for info in reader.iter_containers()] == [
+                info.uncompressed_size for info in containers
+            ]
+
+
+def test_object_cursor():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 300, Compression.DEFAULT)
+        index = build_index(path)
+
+        with BlfReader(path) as reader:
+            cursor = reader.cursor()
+            assert next(cursor) is cursor
+            assert cursor.decode() == objects[0]
+            assert reader.read_object() == objects[1]
+
+            frame_id_format = struct.Struct("I")
+            for obj, position in zip(objects[2:], cursor):
+                assert position is cursor
+                assert cursor.object_type == obj.header.base.object_type
+                assert cursor.object_size == obj.header.base.object_size
+                assert cursor.object_flags == obj.header.object_flags
+                assert cursor.object_time_stamp == obj.header.object_time_stamp
+                assert cursor.unpack_from(frame_id_format, 36) == (obj.frame_id,)
+                assert cursor.raw() == obj.pack()
+            with pytest.raises(StopIteration):
+                next(cursor)
+
+        # the cursor follows the reader position
+        with BlfReader(path) as reader:
+            cursor = reader.cursor()
+            reader.skip(250, index)
+            assert next(cursor).decode() == objects[250]
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_bulk_unpack(compression_level: Compression):
+    names = [
+        "CAN_MESSAGE",
+        "CAN_MESSAGE2",
+        "CAN_FD_MESSAGE",
+        "CAN_FD_MESSAGE_64",
+        "CAN_ERROR",
+        "CAN_OVERLOAD",
+        "CAN_DRIVER_ERROR",
+        "CAN_DRIVER_SYNC",
+    ]
+    raw_objects = [(DATA_DIR / f"{name}.lobj").read_bytes() for name in names]
+    for raw in raw_objects:
+        base = ObjectHeaderBase.unpack_from(raw)
+        assert _get_bulk_decoder(OBJ_MAP[base.object_type], base.object_size) is not None
+
+    # runs of objects of the same type and size, interrupted by other objects
+    sequence = []
+    for i in range(300):
+        raw = bytearray(raw_objects[(i // 20) % len(raw_objects)])
+        struct.pack_into("Q", raw, 24, i)
+        if i == 65:
+            # CanFdMessage64 with extended frame data
+            struct.pack_into("B", raw, 67, 80)
+        sequence.append(bytes(raw))
+        if i % 37 == 0:
+            sequence.append((DATA_DIR / "APP_TEXT.lobj").read_bytes())
+    expected = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path, compression_level=compression_level, buffer_size=1000) as writer:
+            for raw in sequence:
+                base = ObjectHeaderBase.unpack_from(raw)
+                obj = OBJ_MAP[base.object_type].unpack(raw)
+                writer.write(obj)
+                expected.append(obj)
+
+        with BlfReader(path) as reader:
+            assert list(reader) == expected
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_bulk_unpack_mixed_sizes(compression_level: Compression):
+    original = CanFdMessage64.unpack((DATA_DIR / "CAN_FD_MESSAGE_64.lobj").read_bytes())
+    # consecutive objects with different data lengths, so that runs must not continue
+    expected = []
+    for i, data_length in enumerate([4, 8, 6, 0, 0, 8, 8, 64, 12, 12, 4] * 10):
+        header = replace(original.header, base=replace(original.header.base))
+        header.base.object_size = ObjectHeader.SIZE + CanFdMessage64._FORMAT.size + data_length
+        header.object_time_stamp = i
+        data = bytes((i + j) % 256 for j in range(data_length))
+        expected.append(
+            replace(
+                original,
+                header=header,
+                valid_data_bytes=data_length,
+                ext_data_offset=0,
+                data=data,
+                btr_ext_arb=0,
+                btr_ext_data=0,
+            )
+        )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path, compression_level=compression_level) as writer:
+            for obj in expected:
+                writer.write(obj)
+
+        with BlfReader(path) as reader:
+            assert list(reader) == expected
+
+
+def test_object_class_map():
+    assert OBJ_MAP[ObjType.CAN_MESSAGE] is CanMessage
+    assert OBJ_MAP.get(ObjType.CAN_MESSAGE) is CanMessage
+    assert OBJ_MAP[ObjType.ETHERNET_FRAME] is None
+    assert OBJ_MAP.get(0xFFFF) is None
+    assert OBJ_MAP.get(0xFFFF, NotImplementedObject) is NotImplementedObject
+    with pytest.raises(KeyError):
+        OBJ_MAP[0xFFFF]
+    assert ObjType.CAN_MESSAGE in OBJ_MAP
+    assert len(OBJ_MAP) == len(list(OBJ_MAP))
+
+    # classes can be replaced and added like in a dict
+    OBJ_MAP[ObjType.ETHERNET_FRAME] = NotImplementedObject
+    OBJ_MAP[0xFFFF] = NotImplementedObject
+    try:
+        assert OBJ_MAP[ObjType.ETHERNET_FRAME] is NotImplementedObject
+        assert OBJ_MAP.get(0xFFFF) is NotImplementedObject
+        assert 0xFFFF in list(OBJ_MAP)
+    finally:
+        OBJ_MAP[ObjType.ETHERNET_FRAME] = None
+        del OBJ_MAP[0xFFFF]
+    assert OBJ_MAP.get(0xFFFF) is None
+    with pytest.raises(KeyError):
+        del OBJ_MAP[0xFFFF]
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, vblf.reader\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+        "vblf.reader.OBJ_MAP[vblf.reader.ObjType.LIN_MESSAGE]\n"
+        "print('vblf.lin' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules, lin_imported = result.stdout.splitlines()
+    for module in ("vblf.can", "vblf.lin", "vblf.ethernet", "importlib.metadata"):
+        assert module not in modules.split()
+    assert lin_imported == "True"
+
+
+def test_decoders():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 100, Compression.DEFAULT)
+        decoders = {ObjType.CAN_MESSAGE: lambda data: ObjectHeaderBase.unpack_from(data)}
+
+        with BlfReader(path, decoders=decoders) as reader:
+            assert list(reader) == [obj.header.base for obj in objects]
+            assert reader.tail(1) == [objects[-1].header.base]
+        with BlfReader(path, decoders=decoders) as reader:
+            assert next(reader.cursor()).decode() == objects[0].header.base
+        with BlfReader.from_cursor(
+            path, ReaderCursor(FileStatistics.SIZE, 0, b""), decoders=decoders
+        ) as reader:
+            assert reader.read_object() == objects[0].header.base
+        with BlfSequenceReader([path], decoders=decoders) as reader:
+            assert next(iter(reader)) == objects[0].header.base
+
+        # other readers are not affected
+        with BlfReader(path) as reader:
+            assert list(reader) == objects
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_stats(compression_level: Compression):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 100, compression_level)
+        with BlfReader(path) as reader:
+            containers = list(reader.iter_containers())
+        boundaries = itertools.accumulate(info.uncompressed_size for info in containers[:-1])
+        straddling_objects = sum(1 for boundary in boundaries if boundary % 48)
+        assert straddling_objects > 0
+
+        # bytes between the file statistics and the first LogContainer must be skipped
+        data = path.read_bytes()
+        data = data[: FileStatistics.SIZE] + bytes(16) + data[FileStatistics.SIZE :]
+        for file in (data, io.BytesIO(data)):
+            stats = ReaderStats()
+            with BlfReader(file, stats=stats) as reader:
+                assert list(reader) == objects
+            assert stats.bytes_read == len(data)
+            assert stats.resync_bytes == 16
+            assert stats.straddling_objects == straddling_objects
+            assert stats.object_counts == {ObjType.CAN_MESSAGE: 100}
+            assert list(stats.parse_time) == [ObjType.CAN_MESSAGE]
+            assert stats.not_implemented_objects == 0
+            if compression_level == Compression.NONE:
+                assert stats.containers_decompressed == 0
+            else:
+                assert stats.containers_decompressed == len(containers)
+                assert stats.decompression_time > 0
+
+        # unknown objects and decoders
+        stats = ReaderStats()
+        decoders = {ObjType.CAN_MESSAGE: lambda data: NotImplementedObject.unpack(data)}
+        with BlfReader(path, stats=stats, decoders=decoders) as reader:
+            assert len(list(reader)) == 100
+        assert stats.not_implemented_objects == 0
+        raw = bytearray((DATA_DIR / "CAN_MESSAGE.lobj").read_bytes())
+        struct.pack_into("I", raw, 12, ObjType.ETHERNET_FRAME)
+        with BlfWriter(path) as writer:
+            writer.write(NotImplementedObject.unpack(bytes(raw)))
+        with BlfReader(path, stats=stats) as reader:
+            assert len(list(reader)) == 1
+        assert stats.not_implemented_objects == 1
+        assert stats.object_counts == {ObjType.CAN_MESSAGE: 100, ObjType.ETHERNET_FRAME: 1}
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_stream_read_after_seek(compression_level: Compression):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        objects = _write_blf(path, 500, compression_level)
+        index = build_index(path)
+        container = index.containers[len(index.containers) // 2]
+        assert container.first_object_offset + 48 <= container.data_size
+        first = sum(c.object_count for c in index.containers[: len(index.containers) // 2])
+
+        # only the LogContainer of the first object is read after jumping to a cursor
+        stats = ReaderStats()
+        with BlfReader.from_cursor(path, container.cursor(), stats=stats) as reader:
+            assert reader.read_object() == objects[first]
+            assert stats.bytes_read == FileStatistics.SIZE + container.object_size
+            assert list(reader) == objects[first + 1 :]
+        assert stats.bytes_read == path.stat().st_size - container.offset + FileStatistics.SIZE
@@ -0,0 +1,76 @@
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from tests import DATA_DIR
+from vblf.can import CanMessage
+from vblf.constants import OBJ_SIGNATURE, Compression, ObjFlags, ObjType
+from vblf.general import NotImplementedObject, ObjectHeaderBase
+from vblf.reader import OBJ_MAP, BlfReader
+from vblf.scan import summarize
+from vblf.writer import BlfWriter
+
+
+def test_summarize():
+    objects = []
+    for fp in sorted(DATA_DIR.rglob("*.lobj")):
+        obj_data = fp.read_bytes()
+        base = ObjectHeaderBase.unpack_from(obj_data)
+        obj_class = OBJ_MAP.get(base.object_type)
+        if base.object_type is ObjType.LOG_CONTAINER or not obj_class:
+            continue
+        objects.append(obj_class.unpack(obj_data))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path, compression_level=Compression.DEFAULT, buffer_size=512) as writer:
+            for obj in objects:
+                writer.write(obj)
+        summary = summarize(path)
+        with BlfReader(path) as reader:
+            read_objects = list(reader)
+
+    counts = Counter(obj.header.base.object_type for obj in read_objects)
+    assert summary.object_count == len(objects)
+    assert summary.byte_count == sum(obj.header.base.object_size for obj in objects)
+    assert {t: s.count for t, s in summary.object_types.items()} == counts
+
+    time_stamps = [
+        obj.header.object_time_stamp
+        * (10_000 if obj.header.object_flags & ObjFlags.TIME_TEN_MICS else 1)
+        for obj in read_objects
+    ]
+    assert summary.first_time_stamp == min(time_stamps)
+    assert summary.last_time_stamp == max(time_stamps)
+
+    can_summary = summary.object_types[ObjType.CAN_MESSAGE]
+    assert can_summary.channels == {0x1111}
+    assert can_summary.byte_count == 48
+    for obj in read_objects:
+        obj_type = obj.header.base.object_type
+        if hasattr(obj, "channel"):
+            assert obj.channel in summary.object_types[obj_type].channels
+    assert summary.object_types[ObjType.LIN_MESSAGE2].channels == {
+        obj.lin_timestamp_event.lin_msg_descr_event.lin_synch_field_event.lin_bus_event.channel
+        for obj in read_objects
+        if obj.header.base.object_type is ObjType.LIN_MESSAGE2
+    }
+
+
+def test_summarize_short_object():
+    can_message = CanMessage.unpack((DATA_DIR / "CAN_MESSAGE.lobj").read_bytes())
+    # object with a CAN message type that ends before its time stamp and channel
+    short_data = ObjectHeaderBase(OBJ_SIGNATURE, 16, 1, 24, ObjType.CAN_MESSAGE).pack() + bytes(8)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.blf"
+        with BlfWriter(path) as writer:
+            writer.write(NotImplementedObject.unpack(short_data))
+            writer.write(can_message)
+        summary = summarize(path)
+
+    can_summary = summary.object_types[ObjType.CAN_MESSAGE]
+    assert can_summary.count == 2
+    assert can_summary.byte_count == 24 + 48
+    assert can_summary.channels == {can_message.channel}
+    assert can_summary.first_time_stamp == can_summary.last_time_stamp
@@ -1,14 +1,18 @@
+import io
+import os
+import struct
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
 
 from tests import DATA_DIR
-from vblf.can import CanFdMessage64
-from vblf.constants import Compression, ObjType
-from vblf.general import ObjectHeaderBase
+from vblf.can import CanFdMessage64, CanMessage
+from vblf.constants import Compression, CompressionMethod, ObjType
+from vblf.general import LogContainer, NotImplementedObject, ObjectHeaderBase
 from vblf.reader import OBJ_MAP, BlfReader
-from vblf.writer import BlfWriter
+from vblf.writer import BlfWriter, ContainerStats, WriterStats
 
 
 @pytest.mark.parametrize(
@@ -74,3 +78,155 @@ def test_writer_buffer(compression_level: Compression):
                 read_count += 1
                 assert written_obj == original_obj
             assert read_count == write_count
+
+
+def test_writer_max_latency():
+    lobj_path = DATA_DIR / f"{ObjType.CAN_MESSAGE.name}.lobj"
+    original_obj = CanMessage.unpack(lobj_path.read_bytes())
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = Path(temp_dir) / "test_output.blf"
+        with BlfWriter(output_file, max_latency=0.05) as writer:
+            writer.write(original_obj)
+
+            # the object must become visible without closing the writer
+            deadline = time.monotonic() + 5.0
+            objects = []
+            while not objects and time.monotonic() < deadline:
+                time.sleep(0.01)
+                with BlfReader(output_file) as reader:
+                    objects = list(reader)
+            assert objects == [original_obj]
+
+            # a second object is flushed in a new container
+            writer.write(original_obj)
+            time.sleep(0.2)
+            with BlfReader(output_file) as reader:
+                assert list(reader) == [original_obj, original_obj]
+
+        with BlfReader(output_file) as reader:
+            assert reader.file_statistics.object_count == 2
+            assert list(reader) == [original_obj, original_obj]
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_writer_append(compression_level: Compression):
+    lobj_data = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    original_obj = CanMessage.unpack(lobj_data)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = Path(temp_dir) / "test_output.blf"
+        writer = BlfWriter(output_file, compression_level=compression_level, buffer_size=1024)
+        with writer:
+            for _ in range(100):
+                writer.write(original_obj)
+        with BlfWriter(output_file, mode="append", buffer_size=1024) as writer:
+            for _ in range(50):
+                writer.write(original_obj)
+
+        with BlfReader(output_file) as reader:
+            assert reader.file_statistics.compression_level == compression_level
+            assert reader.file_statistics.object_count == 150
+            assert reader.file_statistics.file_size == output_file.stat().st_size
+            assert list(reader) == [original_obj] * 150
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+@pytest.mark.parametrize("torn_bytes", [0, 10])
+def test_writer_append_after_crash(compression_level: Compression, torn_bytes: int):
+    lobj_data = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    original_obj = CanMessage.unpack(lobj_data)
+
+    # simulate a crash: the writer is not closed, an object straddles the last container
+    stream = io.BytesIO()
+    writer = BlfWriter(stream, compression_level=compression_level, buffer_size=1024)
+    for _ in range(100):
+        writer.write(original_obj)
+    crashed_data = stream.getvalue()
+    crashed_data = crashed_data[: len(crashed_data) - torn_bytes]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = Path(temp_dir) / "test_output.blf"
+        output_file.write_bytes(crashed_data)
+        with BlfReader(output_file) as reader:
+            recovered_count = len(list(reader))
+        assert 0 < recovered_count < 100
+
+        with BlfWriter(output_file, mode="append") as writer:
+            for _ in range(10):
+                writer.write(original_obj)
+
+        with BlfReader(output_file) as reader:
+            assert reader.file_statistics.object_count == recovered_count + 10
+            assert list(reader) == [original_obj] * (recovered_count + 10)
+
+
+def test_writer_incompressible_data():
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    # object with a random payload, that cannot be compressed
+    random_object_data = bytearray(raw + os.urandom(4000))
+    struct.pack_into("II", random_object_data, 8, len(random_object_data), ObjType.ETHERNET_FRAME)
+    assert OBJ_MAP.get(ObjType.ETHERNET_FRAME) is None
+    random_object = NotImplementedObject.unpack(bytes(random_object_data))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = Path(temp_dir) / "test_output.blf"
+        with BlfWriter(output_file, compression_level=Compression.DEFAULT) as writer:
+            writer.write(random_object)
+            writer.flush()
+            writer.write(CanMessage.unpack(raw))
+
+        with BlfReader(output_file) as reader:
+            containers = list(reader.iter_containers())
+        assert [info.compression_method for info in containers] == [
+            CompressionMethod.NONE,
+            CompressionMethod.ZLIB_DEFLATE,
+        ]
+        assert [info.compressed for info in containers] == [False, True]
+        assert containers[0].uncompressed_size == len(random_object_data)
+
+        data = output_file.read_bytes()
+        container = LogContainer.unpack(data[containers[1].offset : containers[1].end_offset])
+        assert container.header.uncompressed_size == len(raw)
+        assert LogContainer.unpack(container.pack()) == container
+
+        with BlfReader(output_file) as reader:
+            assert list(reader) == [random_object, CanMessage.unpack(raw)]
+
+
+@pytest.mark.parametrize("compression_level", [Compression.NONE, Compression.DEFAULT])
+def test_writer_stats(compression_level: Compression):
+    raw = (DATA_DIR / "CAN_MESSAGE.lobj").read_bytes()
+    stats = WriterStats()
+    containers: list[ContainerStats] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = Path(temp_dir) / "test_output.blf"
+        with BlfWriter(
+            output_file,
+            compression_level=compression_level,
+            buffer_size=1024,
+            stats=stats,
+            on_container=containers.append,
+        ) as writer:
+            for _ in range(100):
+                writer.write(CanMessage.unpack(raw))
+
+        with BlfReader(output_file) as reader:
+            infos = list(reader.iter_containers())
+
+    assert [c.offset for c in containers] == [info.offset for info in infos]
+    assert [c.compressed_size for c in containers] == [info.compressed_size for info in infos]
+    assert [c.uncompressed_size for c in containers] == [info.uncompressed_size for info in infos]
+    assert [c.compression_method for c in containers] == [info.compression_method for info in infos]
+    # only the last LogContainer is written on close
+    assert [c.stalled for c in containers] == [True] * (len(containers) - 1) + [False]
+
+    assert stats.containers_written == len(containers)
+    assert stats.uncompressed_size == sum(c.uncompressed_size for c in containers)
+    assert stats.compressed_size == sum(c.compressed_size for c in containers)
+    assert 0 < stats.stall_time <= stats.compression_time + stats.write_time
+    assert stats.throughput > 0
+    if compression_level == Compression.NONE:
+        assert stats.compression_ratio == 1.0
+    else:
+        assert stats.compression_ratio > 1.0